@@ -24,17 +24,48 @@ We are handling support tickets based on their severity.
     👔 Level 3: Management Support
 """
 
+from bisect import bisect_right
+import heapq
+import queue
+import threading
+import time
+import weakref
+
 # Abstract Handler
+# level can be a single level (1), a range of levels (range(1, 4)) or a predicate (lambda level: level > 3)
 class SupportHandler:
     def __init__(self, level):
+        self._compiled = weakref.WeakSet()  # compiled chains that reach this handler, rebuilt after a change
         self.level = level
         self.next_handler = None
 
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, level):
+        self._level = level
+        self._invalidate()
+
     def set_next(self, next_handler):
         self.next_handler = next_handler
+        self._invalidate()
+
+    def _invalidate(self):
+        for chain in list(self._compiled):
+            with chain._lock:  # waits for a rebuild in progress, so the change can't be missed
+                chain._stale = True
+
+    def can_handle(self, level):
+        if callable(self.level):
+            return self.level(level)
+        if isinstance(self.level, range):
+            return level in self.level
+        return self.level == level
 
     def handle_request(self, level, message):
-        if self.level == level:
+        if self.can_handle(level):
             self.process(message)
         elif self.next_handler:
             self.next_handler.handle_request(level, message)
@@ -44,6 +75,109 @@ class SupportHandler:
     def process(self, message):
         pass
 
+    def compile(self):
+        return CompiledChain(self)
+
+# Returns level as an int when it equals one (2.0 -> 2), otherwise None
+def _integral(level):
+    try:
+        value = int(level)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return value if value == level else None
+
+# Compiled Chain
+"""
+Flattens the chain starting at head into lookup tables, so a request goes straight to its handler
+instead of walking next_handler links:
+    exact levels      -> dict            O(1)
+    contiguous ranges -> interval index  O(log n), each interval owned by the first covering handler in the chain
+    predicates        -> only checked if they come before the best indexed match in the chain
+The first handler in chain order still wins, exactly like handle_request.
+The tables are rebuilt automatically after a set_next or level change on any handler the chain reaches.
+Rebuilds happen under a lock and the new tables are published in one assignment, so concurrent callers
+(e.g. SupportPipeline submitters) always see a complete set of tables.
+"""
+class CompiledChain:
+    def __init__(self, head: SupportHandler):
+        self.head = head
+        self._handlers = []  # handlers reached by the last build, which notify this chain when they change
+        self._tables = ({}, [], [], [])  # exact, starts, owners, predicates
+        self._lock = threading.Lock()    # serializes rebuilds against each other and against invalidation
+        self._stale = True
+
+    def _refresh(self):
+        with self._lock:
+            if self._stale:
+                self._build()
+
+    # Called with self._lock held
+    def _build(self):
+        exact = {}
+        ranges = []      # (start, stop, position, handler)
+        predicates = []  # (position, handler)
+        seen = set()
+        for handler in self._handlers:
+            handler._compiled.discard(self)
+        handlers = []
+        handler, position = self.head, 0
+        while handler is not None and id(handler) not in seen:
+            seen.add(id(handler))
+            handler._compiled.add(self)
+            handlers.append(handler)
+            level = handler.level
+            if isinstance(level, range) and level.step == 1:
+                if len(level):
+                    ranges.append((level.start, level.stop, position, handler))
+            elif callable(level) or isinstance(level, range):
+                predicates.append((position, handler))
+            elif level not in exact:
+                exact[level] = (position, handler)
+            handler, position = handler.next_handler, position + 1
+
+        # Sweep the range boundaries and keep, for every elementary interval, the earliest handler covering it
+        boundaries = sorted({point for start, stop, _, _ in ranges for point in (start, stop)})
+        ranges.sort(key=lambda entry: entry[0])
+        starts, owners = [], []
+        active, index = [], 0
+        for point in boundaries:
+            while index < len(ranges) and ranges[index][0] <= point:
+                start, stop, position, handler = ranges[index]
+                heapq.heappush(active, (position, stop, handler))
+                index += 1
+            while active and active[0][1] <= point:
+                heapq.heappop(active)
+            starts.append(point)
+            owners.append((active[0][0], active[0][2]) if active else None)
+
+        self._handlers = handlers
+        self._tables = (exact, starts, owners, predicates)
+        self._stale = False
+
+    def find_handler(self, level):
+        if self._stale:
+            self._refresh()
+        exact, starts, owners, predicates = self._tables
+        best = exact.get(level)
+        # The interval index only takes integral levels: 2.0 is in range(1, 4), 2.5 and "2" are not
+        point = level if isinstance(level, int) else _integral(level)
+        index = bisect_right(starts, point) - 1 if point is not None else -1
+        if index >= 0 and owners[index] is not None and (best is None or owners[index][0] < best[0]):
+            best = owners[index]
+        for position, handler in predicates:
+            if best is not None and position > best[0]:
+                break
+            if handler.can_handle(level):
+                return handler
+        return best[1] if best is not None else None
+
+    def handle_request(self, level, message):
+        handler = self.find_handler(level)
+        if handler is not None:
+            handler.process(message)
+        else:
+            print("No handler found for this level!")
+
 # Concrete Handlers
 class BasicSupport(SupportHandler):
     def process(self, message):
@@ -58,6 +192,120 @@ class ManagementSupport(SupportHandler):
         print(f"[Management Support] Handling request: {message}")
 
 
+# Concurrent Pipeline
+"""
+Every handler in the chain becomes a stage with its own bounded queue and worker threads.
+Tickets are routed straight to the stage that owns their level (using CompiledChain), so a surge of
+level 1 tickets fills only the level 1 queue and never delays level 3 handling.
+When a stage's queue is full, submit() blocks (backpressure) or raises queue.Full after its timeout.
+"""
+class StageMetrics:
+    def __init__(self):
+        self.processed = 0
+        self.failed = 0
+        self.total_wait = 0.0     # time spent queued
+        self.total_service = 0.0  # time spent in process()
+        self.max_latency = 0.0
+        self.max_queue_depth = 0
+
+    def snapshot(self, queue_depth):
+        done = self.processed + self.failed
+        return {
+            "processed": self.processed,
+            "failed": self.failed,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_wait_ms": 1000 * self.total_wait / done if done else 0.0,
+            "avg_service_ms": 1000 * self.total_service / done if done else 0.0,
+            "max_latency_ms": 1000 * self.max_latency,
+        }
+
+class PipelineStage:
+    def __init__(self, handler: SupportHandler, queue_size, workers):
+        self.handler = handler
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.metrics = StageMetrics()
+        self._lock = threading.Lock()
+        self._workers = [threading.Thread(target=self._run, daemon=True) for _ in range(workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, message, timeout=None):
+        self.queue.put((message, time.perf_counter()), timeout=timeout)
+        depth = self.queue.qsize()
+        with self._lock:
+            self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, depth)
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            message, submitted_at = item
+            started = time.perf_counter()
+            try:
+                self.handler.process(message)
+                failed = False
+            except Exception:
+                failed = True
+            finished = time.perf_counter()
+            with self._lock:
+                if failed:
+                    self.metrics.failed += 1
+                else:
+                    self.metrics.processed += 1
+                self.metrics.total_wait += started - submitted_at
+                self.metrics.total_service += finished - started
+                self.metrics.max_latency = max(self.metrics.max_latency, finished - submitted_at)
+            self.queue.task_done()
+
+    def stop(self):
+        for _ in self._workers:
+            self.queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+class SupportPipeline:
+    def __init__(self, head: SupportHandler, queue_size=100, workers_per_stage=2):
+        self.chain = head.compile()
+        self.queue_size = queue_size
+        self.workers_per_stage = workers_per_stage
+        self.stages = {}  # id(handler) -> PipelineStage, created when a handler first receives a ticket
+        self._lock = threading.Lock()
+
+    def _stage_for(self, handler):
+        stage = self.stages.get(id(handler))
+        if stage is None:
+            with self._lock:
+                stage = self.stages.get(id(handler))
+                if stage is None:
+                    stage = self.stages[id(handler)] = PipelineStage(handler, self.queue_size, self.workers_per_stage)
+        return stage
+
+    def submit(self, level, message, timeout=None):
+        handler = self.chain.find_handler(level)
+        if handler is None:
+            print("No handler found for this level!")
+            return False
+        self._stage_for(handler).submit(message, timeout)
+        return True
+
+    def join(self):
+        for stage in list(self.stages.values()):
+            stage.queue.join()
+
+    def metrics(self):
+        return {f"{type(stage.handler).__name__}({stage.handler.level})": stage.metrics.snapshot(stage.queue.qsize())
+                for stage in self.stages.values()}
+
+    def shutdown(self):
+        self.join()
+        for stage in self.stages.values():
+            stage.stop()
+        self.stages = {}
+
+
 # Main - Building the Chain
 if __name__ == "__main__":
     basic = BasicSupport(level=1)
@@ -79,3 +327,21 @@ if __name__ == "__main__":
 
     print("\nSending Level 4 Request:")
     basic.handle_request(level=4, message="Unknown issue.")
+
+    # Compiled chain: same routing, without walking the links
+    chain = basic.compile()
+    print("\nSending Level 3 Request through the compiled chain:")
+    chain.handle_request(level=3, message="Contract renewal.")
+
+    # Changing the chain is picked up automatically
+    management.set_next(ManagementSupport(level=range(4, 10)))
+    print("\nSending Level 4 Request after extending the chain:")
+    chain.handle_request(level=4, message="Escalated complaint.")
+
+    # Concurrent pipeline: each level has its own queue and workers
+    print("\nProcessing tickets through the pipeline:")
+    pipeline = SupportPipeline(basic, queue_size=10, workers_per_stage=2)
+    for ticket in range(3):
+        pipeline.submit(level=1, message=f"Password reset #{ticket}")
+    pipeline.submit(level=3, message="Budget approval needed.")
+    pipeline.shutdown()
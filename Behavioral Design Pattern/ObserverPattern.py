@@ -39,6 +39,11 @@ MVC pattern (View observes Model)
 
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+import weakref
 
 # Observer Interface
 class Observer(ABC):
@@ -60,25 +65,228 @@ class Subject(ABC):
     def notify_observers(self, video_title):
         pass
 
+# Delivery Report: result of an asynchronous notification round
+class DeliveryReport:
+    def __init__(self, total):
+        self.total = total
+        self.delivered = 0
+        self.failures = []   # (observer, exception)
+        self.timed_out = []  # observers whose update took longer than observer_timeout or missed delivery_timeout
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        return self.delivered / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (f"Delivered {self.delivered}/{self.total}, failures: {len(self.failures)}, "
+                f"timed out: {len(self.timed_out)}, {self.throughput:.0f} notifications/sec")
+
+# One asynchronous notification round
+# Workers claim observers through a cursor per batch. With observer_timeout set, a watchdog thread looks for updates
+# that have been running longer than that: a running thread can't be interrupted, so the observer is reported as
+# timed out and the rest of its batch is resubmitted to another worker. Once delivery_timeout passes, every observer
+# whose delivery wasn't confirmed is reported as timed out and the Future resolves with what was delivered.
+class _DeliveryRound:
+    def __init__(self, executor, video_title, subscribers, batch_size, observer_timeout=None, delivery_timeout=None):
+        self.executor = executor
+        self.video_title = video_title
+        self.observer_timeout = observer_timeout
+        self.delivery_timeout = delivery_timeout
+        self.report = DeliveryReport(len(subscribers))
+        self.future = Future()
+        self.batches = [subscribers[i:i + batch_size] for i in range(0, len(subscribers), batch_size)]
+        self.cursors = [0] * len(self.batches)
+        self.remaining = len(subscribers)  # observers not accounted for yet
+        self.in_flight = {}                # (batch index, position) -> start time of the running update
+        self.abandoned = set()             # in-flight updates already reported as timed out
+        self.finished = threading.Event()
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+
+    def start(self):
+        if not self.batches:
+            self._finish()
+            return
+        if self.observer_timeout is not None or self.delivery_timeout is not None:
+            threading.Thread(target=self._watch, daemon=True).start()
+        self._submit(range(len(self.batches)))
+
+    def _submit(self, batch_indexes):
+        try:
+            for batch_index in batch_indexes:
+                self.executor.submit(self._deliver, batch_index)
+        except Exception as e:  # e.g. the executor was shut down; stop the round instead of leaving the Future pending
+            with self.lock:
+                first = not self.finished.is_set()
+                self.finished.set()
+            if first:
+                self.future.set_exception(e)
+
+    def _deliver(self, batch_index):
+        batch = self.batches[batch_index]
+        report = self.report
+        # Observers are only claimed one at a time when the watchdog may need to take over the rest of the batch
+        step = 1 if self.observer_timeout is not None else len(batch)
+        while True:
+            with self.lock:
+                position = self.cursors[batch_index]
+                if position >= len(batch) or self.finished.is_set():
+                    return
+                end = self.cursors[batch_index] = min(position + step, len(batch))
+                key = (batch_index, position)
+                self.in_flight[key] = (time.perf_counter(), end)
+            delivered, failures, timed_out = 0, [], []
+            for observer in batch[position:end]:
+                observer_started = time.perf_counter()
+                try:
+                    observer.update(self.video_title)
+                    delivered += 1
+                except Exception as e:
+                    failures.append((observer, e))
+                if self.observer_timeout is not None and time.perf_counter() - observer_started > self.observer_timeout:
+                    timed_out.append(observer)
+            with self.lock:
+                del self.in_flight[key]
+                if key in self.abandoned:  # already reported, and the batch has moved on
+                    self.abandoned.discard(key)
+                    continue
+                if self.finished.is_set():
+                    return
+                report.delivered += delivered
+                report.failures.extend(failures)
+                report.timed_out.extend(timed_out)
+                self.remaining -= end - position
+                done = self.remaining == 0
+            if done:
+                self._finish()
+
+    def _watch(self):
+        timeouts = [t for t in (self.observer_timeout, self.delivery_timeout) if t is not None]
+        interval = min(timeouts) / 2
+        deadline = None if self.delivery_timeout is None else self.started + self.delivery_timeout
+        while not self.finished.wait(interval):
+            now = time.perf_counter()
+            resubmit = []
+            with self.lock:
+                if deadline is not None and now >= deadline:
+                    for (batch_index, position), (_, end) in self.in_flight.items():
+                        if (batch_index, position) not in self.abandoned:
+                            self.abandoned.add((batch_index, position))
+                            self.report.timed_out.extend(self.batches[batch_index][position:end])
+                    for batch_index, batch in enumerate(self.batches):
+                        self.report.timed_out.extend(batch[self.cursors[batch_index]:])
+                        self.cursors[batch_index] = len(batch)
+                    self.remaining = 0
+                elif self.observer_timeout is not None:
+                    for (batch_index, position), (claimed, _) in self.in_flight.items():
+                        if (batch_index, position) not in self.abandoned and now - claimed > self.observer_timeout:
+                            self.abandoned.add((batch_index, position))
+                            self.report.timed_out.append(self.batches[batch_index][position])
+                            self.remaining -= 1
+                            resubmit.append(batch_index)
+                done = self.remaining == 0
+            if done:
+                self._finish()
+                return
+            self._submit(resubmit)
+
+    def _finish(self):
+        with self.lock:
+            if self.finished.is_set():
+                return
+            self.finished.set()
+        self.report.elapsed = time.perf_counter() - self.started
+        self.future.set_result(self.report)
+
+# Weak reference that remembers its registry key, so one shared callback can prune it
+class _ObserverRef(weakref.ref):
+    __slots__ = ('key',)
+
 # Concrete Subject: YouTubeChannel
+# Subscribers live in an insertion-ordered dict keyed by id(observer), so subscribe/unsubscribe are O(1).
+# With weak=True only weak references are held and observers that get garbage collected drop out by themselves.
+# Notification iterates a cached tuple snapshot that is rebuilt only after a change (copy-on-write),
+# so observers may subscribe or unsubscribe while a notification is running.
 class YouTubeChannel(Subject):
-    def __init__(self):
-        self.subscribers = []
+    def __init__(self, max_workers=8, batch_size=1000, observer_timeout=None, weak=False, delivery_timeout=None):
+        self.weak = weak
+        self._registry = {}  # id(observer) -> observer, or a weakref to it in weak mode
+        self._snapshot = None
+        self._prune_callback = self._prune
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.observer_timeout = observer_timeout
+        self.delivery_timeout = delivery_timeout  # deadline for a whole async round
+        self._executor = None  # worker pool is only created on the first async notification
+
+    @property
+    def subscribers(self):
+        if self.weak:
+            return [observer for observer in (ref() for ref in self._get_snapshot()) if observer is not None]
+        return list(self._get_snapshot())
 
     def subscribe(self, observer: Observer):
-        self.subscribers.append(observer)
+        key = id(observer)
+        if key in self._registry:
+            return
+        if self.weak:
+            ref = _ObserverRef(observer, self._prune_callback)
+            ref.key = key
+            self._registry[key] = ref
+        else:
+            self._registry[key] = observer
+        self._snapshot = None
 
     def unsubscribe(self, observer: Observer):
-        self.subscribers.remove(observer)
+        if self._registry.pop(id(observer), None) is not None:
+            self._snapshot = None
+
+    def _prune(self, ref):
+        if self._registry.get(ref.key) is ref:
+            del self._registry[ref.key]
+            self._snapshot = None
+
+    def _get_snapshot(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self._registry.values())
+        return snapshot
 
     def notify_observers(self, video_title):
-        for observer in self.subscribers:
-            observer.update(video_title)
+        if self.weak:
+            for ref in self._get_snapshot():
+                observer = ref()
+                if observer is not None:
+                    observer.update(video_title)
+        else:
+            for observer in self._get_snapshot():
+                observer.update(video_title)
+
+    # Delivers in batches on a worker pool and returns a Future that resolves to a DeliveryReport.
+    # asyncio code can await it with asyncio.wrap_future(future).
+    def notify_observers_async(self, video_title) -> Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        subscribers = self.subscribers  # later (un)subscribes don't affect this round
+        delivery = _DeliveryRound(self._executor, video_title, subscribers, self.batch_size,
+                                  self.observer_timeout, self.delivery_timeout)
+        delivery.start()
+        return delivery.future
 
     def upload_video(self, title):
         print(f"\n📺 New Video Uploaded: {title}")
         self.notify_observers(title)
 
+    def upload_video_async(self, title) -> Future:
+        print(f"\n📺 New Video Uploaded: {title}")
+        return self.notify_observers_async(title)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
 # Concrete Observer: User
 class User(Observer):
     def __init__(self, name):
@@ -87,6 +295,114 @@ class User(Observer):
     def update(self, video_title):
         print(f"🔔 {self.name} got notified: New video - {video_title}")
 
+# --- Topic Event Bus ---
+"""
+Observers subscribe to dotted topic patterns such as "videos.music.*" or "videos.#":
+    *  matches exactly one segment
+    #  matches any number of trailing segments (only as the last segment)
+An optional predicate filters events further, but it is only evaluated for subscriptions whose pattern matched.
+Patterns are stored in a trie keyed by segment, and the matches for each published topic are cached until the
+subscriptions change, so publishing only touches the subscribers that match. The cache keeps the max_routes most
+recently published topics, so high-cardinality topics (e.g. ids in the topic) can't grow it without bound.
+Coalescing subscriptions receive their events in a single batched update(events) call on flush().
+"""
+
+class TopicSubscription:
+    __slots__ = ('observer', 'pattern', 'predicate', 'coalesce')
+
+    def __init__(self, observer: Observer, pattern, predicate=None, coalesce=False):
+        self.observer = observer
+        self.pattern = pattern
+        self.predicate = predicate
+        self.coalesce = coalesce
+
+class _TopicNode:
+    __slots__ = ('children', 'subscriptions')
+
+    def __init__(self):
+        self.children = {}
+        self.subscriptions = []
+
+class EventBus:
+    def __init__(self, max_routes=10000):
+        self._root = _TopicNode()
+        self.max_routes = max_routes
+        self._routes = OrderedDict()  # topic -> matching subscriptions (LRU), cleared when subscriptions change
+        self._subscriptions = {}      # id(observer) -> [(node, subscription)]
+        self._pending = {}            # id(observer) -> (observer, [events]) for coalescing subscriptions
+
+    def subscribe(self, observer: Observer, pattern, predicate=None, coalesce=False):
+        segments = pattern.split('.')
+        if '#' in segments[:-1]:
+            raise ValueError("'#' is only allowed as the last segment of a pattern")
+        node = self._root
+        for segment in segments:
+            node = node.children.setdefault(segment, _TopicNode())
+        subscription = TopicSubscription(observer, pattern, predicate, coalesce)
+        node.subscriptions.append(subscription)
+        self._subscriptions.setdefault(id(observer), []).append((node, subscription))
+        self._routes.clear()
+        return subscription
+
+    def unsubscribe(self, observer: Observer, pattern=None):
+        entries = self._subscriptions.get(id(observer), [])
+        remaining = []
+        for node, subscription in entries:
+            if pattern is None or subscription.pattern == pattern:
+                node.subscriptions.remove(subscription)
+            else:
+                remaining.append((node, subscription))
+        if remaining:
+            self._subscriptions[id(observer)] = remaining
+        else:
+            self._subscriptions.pop(id(observer), None)
+        self._routes.clear()
+
+    def _match(self, topic):
+        routes = self._routes.get(topic)
+        if routes is not None:
+            self._routes.move_to_end(topic)
+        else:
+            segments = topic.split('.')
+            matches = []
+            nodes = [self._root]
+            for segment in segments:
+                next_nodes = []
+                for node in nodes:
+                    if '#' in node.children:
+                        matches.extend(node.children['#'].subscriptions)
+                    if segment in node.children:
+                        next_nodes.append(node.children[segment])
+                    if segment != '*' and '*' in node.children:  # a literal '*' segment was matched just above
+                        next_nodes.append(node.children['*'])
+                nodes = next_nodes
+            for node in nodes:
+                matches.extend(node.subscriptions)
+                if '#' in node.children:  # "videos.#" also matches "videos"
+                    matches.extend(node.children['#'].subscriptions)
+            routes = self._routes[topic] = tuple(matches)
+            if len(self._routes) > self.max_routes:
+                self._routes.popitem(last=False)
+        return routes
+
+    def publish(self, topic, event):
+        for subscription in self._match(topic):
+            if subscription.predicate is not None and not subscription.predicate(event):
+                continue
+            if subscription.coalesce:
+                key = id(subscription.observer)
+                if key not in self._pending:
+                    self._pending[key] = (subscription.observer, [])
+                self._pending[key][1].append(event)
+            else:
+                subscription.observer.update(event)
+
+    # Delivers each coalescing observer's buffered events as one batched update
+    def flush(self):
+        pending, self._pending = self._pending, {}
+        for observer, events in pending.values():
+            observer.update(events)
+
 # Client Code
 if __name__ == "__main__":
     channel = YouTubeChannel()
@@ -102,4 +418,19 @@ if __name__ == "__main__":
     channel.unsubscribe(rahul)
     channel.upload_video("Video two uploaded")
 
+    # Asynchronous delivery: upload returns immediately, wait on the handle when needed
+    handle = channel.upload_video_async("Video three uploaded")
+    print(handle.result())
+    channel.close()
+
+    # Topic event bus: only matching subscribers are notified, digests are coalesced until flush()
+    bus = EventBus()
+    bus.subscribe(ankush, "videos.music.*")
+    bus.subscribe(rahul, "videos.#", predicate=lambda title: "Live" in title)
+    bus.subscribe(User("Digest"), "videos.#", coalesce=True)
+
+    bus.publish("videos.music.rock", "Rock anthem")
+    bus.publish("videos.gaming", "Live speedrun")
+    bus.flush()
+
 
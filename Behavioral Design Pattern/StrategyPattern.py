@@ -33,13 +33,32 @@ Use the Strategy Pattern when:
 #---------------------------------------------Code------------------------------------------------------------------------------
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import time
 
 # Strategy Interface
+# pay_batch and pay_async default to calling pay() once per amount, so existing strategies get them for free;
+# backends with a real bulk or async API override them. The default pay_batch keeps going when one amount
+# fails and returns that exception in its place, so the result says exactly which amounts were paid.
 class PaymentStrategy(ABC):
     @abstractmethod
     def pay(self, amount):
         pass
 
+    def pay_batch(self, amounts):
+        results = []
+        for amount in amounts:
+            try:
+                results.append(self.pay(amount))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def pay_async(self, amount):
+        return await asyncio.to_thread(self.pay, amount)
+
 # Concrete Strategies
 class CreditCardPayment(PaymentStrategy):
     def pay(self, amount):
@@ -53,6 +72,198 @@ class UpiPayment(PaymentStrategy):
     def pay(self, amount):
         print(f"Paid ₹{amount} using UPI.")
 
+# Local stand-in payment backend for benchmarks: no printing, configurable latency
+class LocalPaymentBackend(PaymentStrategy):
+    def __init__(self, latency=0.001, batch_overhead=None, per_item_latency=0.0):
+        self.latency = latency                # cost of one pay() round trip
+        self.batch_overhead = latency if batch_overhead is None else batch_overhead
+        self.per_item_latency = per_item_latency
+        self.total_paid = 0
+        self.calls = 0
+
+    def pay(self, amount):
+        time.sleep(self.latency)
+        self.calls += 1
+        self.total_paid += amount
+        return amount
+
+    def pay_batch(self, amounts):
+        amounts = list(amounts)
+        time.sleep(self.batch_overhead + self.per_item_latency * len(amounts))
+        self.calls += 1
+        self.total_paid += sum(amounts)
+        return amounts
+
+    async def pay_async(self, amount):
+        await asyncio.sleep(self.latency)
+        self.calls += 1
+        self.total_paid += amount
+        return amount
+
+# Strategy Registry
+"""
+Picks a strategy at runtime instead of the caller assigning one by hand, and profiles every call.
+    fastest               -> healthy strategy with the lowest average latency of its successful calls
+                             (strategies never called are tried first, ones that have only failed go last)
+    weighted_round_robin  -> spreads calls over healthy strategies in proportion to their weight
+Circuit breaker: after failure_threshold consecutive failures a strategy is skipped for reset_timeout seconds,
+then exactly one caller gets a trial call (half-open) which either closes the circuit again or re-opens it.
+Failover is opt-in: a call only moves on to the next healthy strategy when it raised one of the retry_on
+exception types, e.g. a connection error raised before the payment was taken. Anything else is re-raised,
+so a payment that may already have gone through is never charged twice.
+Because the registry is itself a PaymentStrategy, it can be handed to ShoppingCart directly.
+"""
+class StrategyStats:
+    def __init__(self, weight):
+        self.weight = weight
+        self.calls = 0
+        self.errors = 0
+        self.avg_latency = 0.0  # exponentially weighted moving average of successful calls, in seconds
+        self.consecutive_failures = 0
+        self.opened_at = None   # set while the circuit is open
+        self.trial_running = False  # a half-open trial call is in flight
+        self.current_weight = 0  # smooth weighted round-robin state
+
+    @property
+    def error_rate(self):
+        return self.errors / self.calls if self.calls else 0.0
+
+    # Failed calls often return early (or time out), so their latency is left out of avg_latency
+    def record(self, latency, failed, alpha=0.2):
+        self.calls += 1
+        if failed:
+            self.errors += 1
+            self.consecutive_failures += 1
+            return
+        successes = self.calls - self.errors
+        self.avg_latency = latency if successes == 1 else (1 - alpha) * self.avg_latency + alpha * latency
+        self.consecutive_failures = 0
+
+class StrategyRegistry(PaymentStrategy):
+    FASTEST = "fastest"
+    WEIGHTED_ROUND_ROBIN = "weighted_round_robin"
+
+    def __init__(self, policy=FASTEST, failure_threshold=3, reset_timeout=30.0, clock=time.monotonic, retry_on=()):
+        if policy not in (self.FASTEST, self.WEIGHTED_ROUND_ROBIN):
+            raise ValueError(f"Unknown selection policy: {policy}")
+        self.policy = policy
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.retry_on = tuple(retry_on)  # exception types that are safe to retry on the next strategy
+        self.strategies = {}  # name -> strategy
+        self.stats = {}       # name -> StrategyStats
+        self._lock = threading.Lock()  # guards stats, circuit state and round-robin weights
+
+    def register(self, name, strategy, weight=1):
+        with self._lock:
+            self.strategies[name] = strategy
+            self.stats[name] = StrategyStats(weight)
+
+    def unregister(self, name):
+        with self._lock:
+            self.strategies.pop(name, None)
+            self.stats.pop(name, None)
+
+    def _state(self, stats):
+        if stats.opened_at is None:
+            return "closed"
+        if self.clock() - stats.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def _available(self, stats):
+        state = self._state(stats)
+        return state == "closed" or (state == "half-open" and not stats.trial_running)
+
+    def is_healthy(self, name):
+        with self._lock:
+            return self._available(self.stats[name])
+
+    def _candidates(self):
+        with self._lock:
+            healthy = [name for name, stats in self.stats.items() if self._available(stats)]
+            if self.policy == self.FASTEST:
+                return sorted(healthy, key=lambda name: self._speed_rank(self.stats[name]))
+            if not healthy:
+                return []
+            total = 0
+            for name in healthy:
+                stats = self.stats[name]
+                stats.current_weight += stats.weight
+                total += stats.weight
+            chosen = max(healthy, key=lambda name: self.stats[name].current_weight)
+            self.stats[chosen].current_weight -= total
+            return [chosen] + [name for name in healthy if name != chosen]
+
+    @staticmethod
+    def _speed_rank(stats):
+        if stats.calls == 0:
+            return (0, 0.0)
+        if stats.calls == stats.errors:  # no successful call, so avg_latency says nothing
+            return (2, 0.0)
+        return (1, stats.avg_latency)
+
+    def select(self):
+        candidates = self._candidates()
+        return candidates[0] if candidates else None
+
+    # Claims the strategy for one call: always granted while closed, granted to a single caller while half-open
+    def _admit(self, name):
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                return None, None
+            state = self._state(stats)
+            if state == "open" or (state == "half-open" and stats.trial_running):
+                return None, None
+            stats.trial_running = state == "half-open"
+            return self.strategies[name], stats
+
+    def _complete(self, stats, latency, failed):
+        with self._lock:
+            stats.record(latency, failed)
+            if not failed:
+                stats.opened_at = None
+            elif stats.trial_running or stats.consecutive_failures >= self.failure_threshold:
+                stats.opened_at = self.clock()
+            stats.trial_running = False
+
+    def invoke(self, method, *args, **kwargs):
+        last_error = None
+        for name in self._candidates():
+            strategy, stats = self._admit(name)
+            if strategy is None:
+                continue
+            started = time.perf_counter()
+            try:
+                result = getattr(strategy, method)(*args, **kwargs)
+            except Exception as e:
+                self._complete(stats, time.perf_counter() - started, failed=True)
+                if not isinstance(e, self.retry_on):
+                    raise
+                last_error = e
+                continue
+            self._complete(stats, time.perf_counter() - started, failed=False)
+            return result
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError("No healthy strategy available")
+
+    def pay(self, amount):
+        return self.invoke("pay", amount)
+
+    # Lets the registry stand in for fee strategies too, e.g. ParkingLot.set_payment_strategy(registry)
+    def calculate_fee(self, duration_hours):
+        return self.invoke("calculate_fee", duration_hours)
+
+    def report(self):
+        with self._lock:
+            return {name: {"calls": stats.calls, "error_rate": round(stats.error_rate, 3),
+                           "avg_latency_ms": round(1000 * stats.avg_latency, 3),
+                           "circuit": self._state(stats)}
+                    for name, stats in self.stats.items()}
+
 # Context Class
 class ShoppingCart:
     def __init__(self, strategy: PaymentStrategy):
@@ -61,6 +272,41 @@ class ShoppingCart:
     def checkout(self, amount):
         self.strategy.pay(amount)
 
+    async def checkout_async(self, amount):
+        return await self.strategy.pay_async(amount)
+
+    # Bulk checkout: orders are (cart, amount) pairs. Orders that share a strategy are grouped and paid with
+    # pay_batch in chunks of batch_size, and at most max_concurrency batches run at once.
+    # Results come back in the same order as the orders, with an exception in place of the result for orders
+    # that failed. With the default pay_batch that is per order. If a bulk backend's pay_batch raises, every
+    # order of that batch gets the exception; whether any of them were charged depends on the backend, so
+    # check with it before retrying. A failing batch never stops the other batches.
+    @staticmethod
+    def checkout_many(orders, batch_size=1000, max_concurrency=8):
+        groups = {}  # id(strategy) -> (strategy, [order index], [amount])
+        for index, (cart, amount) in enumerate(orders):
+            if id(cart.strategy) not in groups:
+                groups[id(cart.strategy)] = (cart.strategy, [], [])
+            _, indexes, amounts = groups[id(cart.strategy)]
+            indexes.append(index)
+            amounts.append(amount)
+
+        results = [None] * sum(len(indexes) for _, indexes, _ in groups.values())
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            jobs = []
+            for strategy, indexes, amounts in groups.values():
+                for start in range(0, len(amounts), batch_size):
+                    future = pool.submit(strategy.pay_batch, amounts[start:start + batch_size])
+                    jobs.append((future, indexes[start:start + batch_size]))
+            for future, indexes in jobs:
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    batch_results = [e] * len(indexes)
+                for index, result in zip(indexes, batch_results):
+                    results[index] = result
+        return results
+
 # Client Code
 if __name__ == "__main__":
     cart1 = ShoppingCart(CreditCardPayment())
@@ -72,3 +318,18 @@ if __name__ == "__main__":
     # Dynamically change strategy
     cart2.strategy = PayPalPayment()
     cart2.checkout(300)
+
+    # Let the registry pick the strategy, routing around a failing backend
+    class FlakyPayPalPayment(PaymentStrategy):
+        def pay(self, amount):
+            raise ConnectionError("PayPal is down")
+
+    registry = StrategyRegistry(policy=StrategyRegistry.WEIGHTED_ROUND_ROBIN, failure_threshold=2,
+                                retry_on=(ConnectionError,))
+    registry.register("paypal", FlakyPayPalPayment(), weight=3)
+    registry.register("upi", UpiPayment(), weight=1)
+
+    cart3 = ShoppingCart(registry)
+    for amount in (100, 200, 300):
+        cart3.checkout(amount)
+    print(registry.report())
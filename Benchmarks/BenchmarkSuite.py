@@ -0,0 +1,381 @@
+#----------------------------------Benchmark Suite--------------------------------------------------------------------------------
+
+"""
+Measures how the main entry points of the pattern and system modules scale with workload size.
+
+    python Benchmarks/BenchmarkSuite.py                                # all workloads, default sizes
+    python Benchmarks/BenchmarkSuite.py --sizes 10 1000 1000000 --only observer
+    python Benchmarks/BenchmarkSuite.py --memory --profile profiles/   # + tracemalloc peaks and cProfile dumps
+    python Benchmarks/BenchmarkSuite.py --output new.json --baseline old.json --threshold 0.1
+
+Each workload builds its inputs for a given size (not timed), then times the operation and reports ops/sec.
+The growth between the last two sizes is used to predict the next one, and sizes predicted to take longer than
+--max-seconds are skipped (quadratic workloads such as the linear slot search would otherwise run for hours at 1M).
+Results are written as JSON; with --baseline the run is compared against a saved result file and the script exits
+with status 1 if throughput dropped or peak memory grew by more than --threshold. Cases faster than --min-seconds
+are not compared, and memory growth below --min-bytes is ignored, so noise on tiny cases doesn't fail the run.
+"""
+
+#-------------------------------------------Code-----------------------------------------------------------------------------
+
+import argparse
+import cProfile
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "Questions"))  # for SingletonBase
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+
+_modules = {}
+
+# The pattern folders contain spaces, so modules are loaded by path (and only when a workload needs them)
+def load_module(relative_path):
+    if relative_path not in _modules:
+        name = Path(relative_path).stem
+        spec = importlib.util.spec_from_file_location(name, ROOT / relative_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[relative_path] = module
+    return _modules[relative_path]
+
+# --- Workload registry ---
+# A workload takes a size and returns (run, ops): run() performs ops operations and is the only timed part.
+WORKLOADS = {}
+
+def workload(name, max_size=None):
+    def register(setup):
+        WORKLOADS[name] = (setup, max_size)
+        return setup
+    return register
+
+@workload("parking_lot.park_vehicle")
+def park_vehicle(size):
+    m = load_module("Questions/ParkingLot.py")
+    m.ParkingLot.reset_instance()
+    lot = m.ParkingLot.get_instance()
+    for i in range(size):
+        lot.add_slot(m.ParkingSlot(f"M{i}", m.SlotType.MEDIUM))
+    vehicles = [m.Vehicle(f"KA{i:07d}", m.VehicleType.FOUR_WHEELER) for i in range(size)]
+
+    def run():
+        for vehicle in vehicles:
+            lot.park_vehicle(vehicle, entry_time=1)
+    return run, size
+
+def _vehicle_specs(m, size):
+    types = list(m.VehicleType)
+    return [(types[i % len(types)], f"LIC{i}") for i in range(size)]
+
+@workload("car_rental.create_vehicle")
+def create_vehicle(size):
+    m = load_module("Questions/CarRentalSystem.py")
+    specs = _vehicle_specs(m, size)
+
+    def run():
+        for vehicle_type, license_number in specs:
+            m.VehicleFactory.create_vehicle(vehicle_type, license_number)
+    return run, size
+
+@workload("car_rental.create_vehicles")
+def create_vehicles(size):
+    m = load_module("Questions/CarRentalSystem.py")
+    specs = _vehicle_specs(m, size)
+
+    def run():
+        m.VehicleFactory.create_vehicles(specs)
+    return run, size
+
+@workload("car_rental.rent_vehicle")
+def rent_vehicle(size):
+    m = load_module("Questions/CarRentalSystem.py")
+    store = m.Store("bench", "Benchmark City")
+    specs = _vehicle_specs(m, size)
+    licenses = [license_number for _, license_number in specs]
+    for vehicle in m.VehicleFactory.create_vehicles(specs):
+        store.add_vehicle(vehicle)
+
+    def run():
+        for license_number in licenses:
+            store.rent_vehicle(license_number)
+    return run, size
+
+@workload("logger.log")
+def logger_log(size):
+    m = load_module("Questions/LoggingSystem.py")
+
+    class NullAppender(m.LogAppender):
+        def append(self, log_message):
+            pass
+
+    m.Logger.reset_instance()
+    logger = m.Logger.get_instance()
+    logger.set_config(m.LoggerConfig(m.LogLevel.INFO, NullAppender()))
+    levels = [m.LogLevel.INFO, m.LogLevel.DEBUG, m.LogLevel.ERROR]
+
+    def run():
+        for i in range(size):
+            logger.log(levels[i % 3], "benchmark message")
+    return run, size
+
+# get_instance() fast path once the instance exists: size calls, from one thread or split over 8 threads
+def _get_instance(size, threads):
+    from SingletonBase import Singleton
+
+    class Service(Singleton):
+        pass
+
+    Service.get_instance()
+    calls = max(1, size // threads)
+
+    def call_many():
+        get_instance = Service.get_instance
+        for _ in range(calls):
+            get_instance()
+
+    def run():
+        workers = [threading.Thread(target=call_many) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    return (call_many if threads == 1 else run), calls * threads
+
+@workload("singleton.get_instance")
+def get_instance(size):
+    return _get_instance(size, 1)
+
+@workload("singleton.get_instance[8 threads]")
+def get_instance_contended(size):
+    return _get_instance(size, 8)
+
+# size is the number of cells; every move is followed by a check_winner call
+def _check_winner(board_name, size):
+    m = load_module("Questions/TicTacToe.py")
+    side = max(3, math.isqrt(size))
+    board = getattr(m, board_name)(side)
+    rng = random.Random(size)
+    moves = min(side * side, 10000)
+    cells = rng.sample(range(side * side), moves)
+
+    def run():
+        for index, cell in enumerate(cells):
+            symbol = 'XO'[index & 1]
+            board.make_move(cell // side, cell % side, symbol)
+            board.check_winner(symbol)
+    return run, moves
+
+@workload("tictactoe.check_winner[Board]")
+def check_winner_board(size):
+    return _check_winner("Board", size)
+
+@workload("tictactoe.check_winner[IncrementalBoard]")
+def check_winner_incremental(size):
+    return _check_winner("IncrementalBoard", size)
+
+@workload("tictactoe.check_winner[BitBoard]", max_size=100000)
+def check_winner_bitboard(size):
+    return _check_winner("BitBoard", size)
+
+@workload("observer.notify_observers")
+def notify_observers(size):
+    m = load_module("Behavioral Design Pattern/ObserverPattern.py")
+
+    class NullObserver(m.Observer):
+        def update(self, video_title):
+            pass
+
+    channel = m.YouTubeChannel()
+    observers = [NullObserver() for _ in range(size)]
+    for observer in observers:
+        channel.subscribe(observer)
+
+    def run():
+        channel.notify_observers("benchmark video")
+    return run, size
+
+def _support_chain(size):
+    m = load_module("Behavioral Design Pattern/ChainOfResponsibilityPattern.py")
+
+    class NullSupport(m.SupportHandler):
+        def process(self, message):
+            pass
+
+    handlers = [NullSupport(level) for level in range(size)]
+    for handler, next_handler in zip(handlers, handlers[1:]):
+        handler.set_next(next_handler)
+    return handlers[0]
+
+# Worst case for the linked walk: every request is for the last level. Recursion depth grows with the chain.
+@workload("chain.handle_request", max_size=10000)
+def handle_request(size):
+    head = _support_chain(size)
+    requests = max(1, 100000 // size)
+
+    def run():
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, size + 1000))
+        try:
+            for _ in range(requests):
+                head.handle_request(size - 1, "benchmark ticket")
+        finally:
+            sys.setrecursionlimit(limit)
+    return run, requests
+
+@workload("chain.compiled.handle_request")
+def compiled_handle_request(size):
+    chain = _support_chain(size).compile()
+    chain.find_handler(0)  # build the tables outside the timed part
+    requests = 100000
+
+    def run():
+        for _ in range(requests):
+            chain.handle_request(size - 1, "benchmark ticket")
+    return run, requests
+
+# --- Runner ---
+def run_case(name, size, repeat, memory, profile_dir):
+    setup, _ = WORKLOADS[name]
+    best = None
+    for _ in range(repeat):
+        run, ops = setup(size)
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    result = {"name": name, "size": size, "ops": ops, "seconds": best,
+              "ops_per_sec": ops / best if best else float("inf")}
+
+    # Memory and profiles come from separate runs so they don't distort the timings
+    if memory:
+        tracemalloc.start()
+        run, _ = setup(size)
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        run()
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+        run, _ = setup(size)
+        profiler = cProfile.Profile()
+        profiler.runcall(run)
+        path = os.path.join(profile_dir, f"{name.replace('/', '_')}-{size}.prof")
+        profiler.dump_stats(path)
+        result["profile"] = path
+    return result
+
+# Extrapolates the time of the next size from how the time grew between the previous two
+def predict_seconds(history, size):
+    if not history:
+        return 0.0
+    last_size, last_seconds = history[-1]
+    exponent = 1.0
+    if len(history) > 1:
+        prev_size, prev_seconds = history[-2]
+        if prev_seconds > 0 and last_seconds > 0:
+            exponent = math.log(last_seconds / prev_seconds) / math.log(last_size / prev_size)
+            exponent = min(max(exponent, 0.0), 3.0)
+    return last_seconds * (size / last_size) ** exponent
+
+def run_suite(names, sizes, repeat=3, memory=False, profile_dir=None, max_seconds=5.0, verbose=True):
+    results = []
+    for name in names:
+        _, max_size = WORKLOADS[name]
+        history = []
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                if verbose:
+                    print(f"{name:45s} {size:>9,d}  skipped (above max size {max_size:,d})")
+                continue
+            predicted = predict_seconds(history, size)
+            if predicted > max_seconds:
+                if verbose:
+                    print(f"{name:45s} {size:>9,d}  skipped (predicted {predicted:,.1f}s > {max_seconds}s)")
+                continue
+            result = run_case(name, size, repeat, memory, profile_dir)
+            history.append((size, result["seconds"]))
+            results.append(result)
+            if verbose:
+                line = f"{name:45s} {size:>9,d}  {result['ops_per_sec']:>14,.0f} ops/s  {result['seconds']:.4f}s"
+                if "peak_bytes" in result:
+                    line += f"  peak {result['peak_bytes'] / 1e6:.1f}MB"
+                print(line, flush=True)
+    return results
+
+# Returns the cases that got slower (or bigger) than the baseline by more than threshold.
+# Timings under min_seconds are mostly noise and are not compared, and peak memory has to grow by more than
+# min_bytes as well, so tiny (or 0-byte) baseline peaks don't fail on a few stray allocations.
+def compare(results, baseline, threshold, min_seconds=0.01, min_bytes=64 * 1024):
+    previous = {(entry["name"], entry["size"]): entry for entry in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if before is None:
+            continue
+        timed = before["seconds"] >= min_seconds and result["seconds"] >= min_seconds
+        if timed and result["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            regressions.append((result["name"], result["size"], "throughput",
+                                before["ops_per_sec"], result["ops_per_sec"]))
+        if "peak_bytes" in result and "peak_bytes" in before and \
+                result["peak_bytes"] - before["peak_bytes"] > max(before["peak_bytes"] * threshold, min_bytes):
+            regressions.append((result["name"], result["size"], "peak memory",
+                                before["peak_bytes"], result["peak_bytes"]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pattern and system modules.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", help="run workloads whose name contains any of these strings")
+    parser.add_argument("--list", action="store_true", help="list the workloads and exit")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best one is kept")
+    parser.add_argument("--max-seconds", type=float, default=5.0)
+    parser.add_argument("--memory", action="store_true", help="record tracemalloc peak memory")
+    parser.add_argument("--profile", metavar="DIR", help="write a cProfile dump per case to DIR")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative regression (0.1 = 10%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.01,
+                        help="don't compare throughput for cases that ran faster than this")
+    parser.add_argument("--min-bytes", type=int, default=64 * 1024,
+                        help="peak memory must also grow by more than this many bytes to count as a regression")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(WORKLOADS))
+        return 0
+    names = [name for name in WORKLOADS if not args.only or any(part in name for part in args.only)]
+    results = run_suite(names, sorted(args.sizes), args.repeat, args.memory, args.profile, args.max_seconds)
+
+    report = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                 "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_seconds, args.min_bytes)
+        for name, size, metric, before, after in regressions:
+            print(f"REGRESSION {name} size={size:,d} {metric}: {before:,.0f} -> {after:,.0f}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
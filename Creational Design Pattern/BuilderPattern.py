@@ -15,39 +15,209 @@ eg. Like a meal builder — sometimes you want fries, sometimes a drink, sometim
 
 #-------------------------------------------Code-----------------------------------------------------------------------------
 
+from functools import lru_cache
+import keyword
+import weakref
+
+# Computer is immutable and uses __slots__, so every build is a separate, compact object
 class Computer:
-    def __init__(self, cpu=None, ram=None, storage=None, gpu=None):
-        self.cpu = cpu
-        self.ram = ram
-        self.storage = storage
-        self.gpu = gpu
+    __slots__ = ('cpu', 'ram', 'storage', 'gpu', 'psu', '__weakref__')
+
+    def __init__(self, cpu=None, ram=None, storage=None, gpu=None, psu=None):
+        _set_cpu(self, cpu)
+        _set_ram(self, ram)
+        _set_storage(self, storage)
+        _set_gpu(self, gpu)
+        _set_psu(self, psu)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Computer is immutable, use ComputerBuilder to make a new one")
+
+    def __delattr__(self, name):
+        raise AttributeError("Computer is immutable, use ComputerBuilder to make a new one")
+
+    def _key(self):
+        return (self.cpu, self.ram, self.storage, self.gpu, self.psu)
+
+    # copy, deepcopy and pickle rebuild through __init__, since the blocked __setattr__ rules out the default path
+    def __reduce__(self):
+        return (type(self), self._key())
+
+    def __eq__(self, other):
+        if not isinstance(other, Computer):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
 
     def __str__(self):
-        return f"CPU: {self.cpu}, RAM: {self.ram}, Storage: {self.storage}, GPU: {self.gpu}"
+        text = f"CPU: {self.cpu}, RAM: {self.ram}, Storage: {self.storage}, GPU: {self.gpu}"
+        return text if self.psu is None else f"{text}, PSU: {self.psu}W"
+
+# Slot setters bypass the blocked __setattr__ (faster than object.__setattr__ by name)
+_set_cpu = Computer.cpu.__set__
+_set_ram = Computer.ram.__set__
+_set_storage = Computer.storage.__set__
+_set_gpu = Computer.gpu.__set__
+_set_psu = Computer.psu.__set__
 
 #Builder Class
+# build() returns a new Computer every time. With intern=True identical configurations share one instance
+# (held weakly, so unused configurations are freed).
 class ComputerBuilder:
-    def __init__(self):
-        self.computer = Computer()
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, intern=False):
+        self.intern = intern
+        self.cpu = None
+        self.ram = None
+        self.storage = None
+        self.gpu = None
+        self.psu = None
 
     def set_cpu(self, cpu):
-        self.computer.cpu = cpu
+        self.cpu = cpu
         return self
 
     def set_ram(self, ram):
-        self.computer.ram = ram
+        self.ram = ram
         return self
 
     def set_storage(self, storage):
-        self.computer.storage = storage
+        self.storage = storage
         return self
 
     def set_gpu(self, gpu):
-        self.computer.gpu = gpu
+        self.gpu = gpu
+        return self
+
+    def set_psu(self, psu):
+        self.psu = psu
         return self
 
     def build(self):
-        return self.computer
+        return self._make((self.cpu, self.ram, self.storage, self.gpu, self.psu), self.intern)
+
+    @classmethod
+    def _make(cls, config, intern):
+        if not intern:
+            return Computer(*config)
+        computer = cls._interned.get(config)
+        if computer is None:
+            computer = cls._interned[config] = Computer(*config)
+        return computer
+
+    # Bulk path: configs are (cpu, ram, storage, gpu[, psu]) tuples, skipping the chained setter calls
+    @classmethod
+    def build_many(cls, configs, intern=False):
+        if not intern:
+            return [Computer(*config) for config in configs]
+        make = cls._make
+        # Keys are padded to all five fields (psu=None), the same key build() interns under
+        return [make(tuple(config) + (None,) * (5 - len(config)), True) for config in configs]
+
+# Builder Spec
+"""
+Declares the fields of a product (defaults, allowed values, per-field checks) and the compatibility rules
+between fields, then compiles them once into a plain construction function:
+
+    build = COMPUTER_SPEC.compile()
+    pc = build(cpu="Intel i9", gpu="RTX 4080", psu=850)
+
+The compiled function takes the fields as ordinary (keyword or positional) arguments, and the validation result
+is memoized per unique configuration, so building the same configuration again only costs a cache lookup.
+Invalid configurations raise ValueError.
+With intern=True the spec keeps its own weak table of built products, so identical configurations share one
+instance (the product class must support weak references).
+"""
+class FieldSpec:
+    def __init__(self, name, default=None, choices=None, check=None):
+        self.name = name
+        self.default = default
+        self.choices = None if choices is None else frozenset(choices)
+        self.check = check  # optional callable(value) -> bool
+
+class CompatibilityRule:
+    def __init__(self, message, check):
+        self.message = message
+        self.check = check  # callable(config dict) -> bool
+
+class BuilderSpec:
+    def __init__(self, product, fields, rules=(), cache_size=65536, intern=False):
+        self.product = product
+        self.fields = list(fields)
+        self.rules = list(rules)
+        self.cache_size = cache_size
+        self.intern = intern
+        self._interned = weakref.WeakValueDictionary()  # config tuple -> product
+
+    # Returns an error message, or None if the configuration is valid
+    def validate(self, config):
+        values = dict(zip((field.name for field in self.fields), config))
+        for field in self.fields:
+            value = values[field.name]
+            if field.choices is not None and value not in field.choices:
+                return f"{field.name}={value!r} is not one of the allowed values"
+            if field.check is not None and not field.check(value):
+                return f"{field.name}={value!r} failed validation"
+        for rule in self.rules:
+            if not rule.check(values):
+                return rule.message
+        return None
+
+    def compile(self):
+        names = [field.name for field in self.fields]
+        # Field names become parameters of generated source, so only plain identifiers are accepted
+        # (names starting with "_" are reserved for the helpers in the generated namespace)
+        for name in names:
+            if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name) or name.startswith("_"):
+                raise ValueError(f"Invalid field name: {name!r}")
+        if len(set(names)) != len(names):
+            raise ValueError("Field names must be unique")
+        params = ", ".join(f"{name}=_default_{name}" for name in names)
+        key = ", ".join(names) + ","
+        call = "_product(" + ", ".join(f"{name}={name}" for name in names) + ")"
+        if self.intern:
+            make = (
+                f"    product = _interned.get(config)\n"
+                f"    if product is None:\n"
+                f"        product = _interned[config] = {call}\n"
+                f"    return product\n"
+            )
+        else:
+            make = f"    return {call}\n"
+        source = (
+            f"def build({params}):\n"
+            f"    config = ({key})\n"
+            f"    error = _validate(config)\n"
+            f"    if error is not None:\n"
+            f"        raise ValueError(error)\n"
+            f"{make}"
+        )
+        namespace = {f"_default_{field.name}": field.default for field in self.fields}
+        namespace.update(_validate=lru_cache(maxsize=self.cache_size)(self.validate),
+                         _product=self.product, _interned=self._interned)
+        exec(source, namespace)
+        build = namespace["build"]
+        build.build_many = lambda configs: [build(*config) for config in configs]
+        build.cache_info = namespace["_validate"].cache_info
+        return build
+
+# Power draw in watts used by the GPU vs power budget rule
+CPU_POWER = {"Intel i3": 65, "Intel i5": 125, "Intel i7": 180, "Intel i9": 250}
+GPU_POWER = {None: 0, "None": 0, "RTX 4060": 115, "RTX 4070": 200, "RTX 4080": 320, "RTX 4090": 450}
+
+COMPUTER_SPEC = BuilderSpec(Computer, [
+    FieldSpec("cpu", default="Intel i5", choices=CPU_POWER),
+    FieldSpec("ram", default="16GB", choices=["8GB", "16GB", "32GB", "64GB"]),
+    FieldSpec("storage", default="512GB SSD"),
+    FieldSpec("gpu", default=None, choices=GPU_POWER),
+    FieldSpec("psu", default=550, check=lambda watts: isinstance(watts, int) and watts > 0),
+], rules=[
+    CompatibilityRule("GPU and CPU need more power than the PSU provides (keep 20% headroom)",
+                      lambda c: (CPU_POWER[c["cpu"]] + GPU_POWER[c["gpu"]] + 100) * 1.2 <= c["psu"]),
+])
 
 # Client_code
 if __name__ == "__main__":
@@ -59,6 +229,17 @@ if __name__ == "__main__":
 
     office_pc = builder.set_cpu("Intel i5").set_ram("16GB").set_storage("512GB SSD").set_gpu("None").build()
     print(office_pc)
+    print(gaming_pc)  # still the gaming configuration, builds no longer alias each other
+
+    catalog = ComputerBuilder.build_many([("Intel i5", "16GB", "512GB SSD", None)] * 3, intern=True)
+    print(catalog[0] is catalog[2])  # True: identical configurations share one instance
+
+    build_computer = COMPUTER_SPEC.compile()
+    print(build_computer(cpu="Intel i9", ram="32GB", gpu="RTX 4080", psu=1000))
+    try:
+        build_computer(cpu="Intel i9", gpu="RTX 4090", psu=650)
+    except ValueError as e:
+        print(f"Rejected: {e}")
 
 
 
@@ -16,16 +16,43 @@ When you need to manage shared resources like:
 """
 #------------------------------------------------Code--------------------------------------------------------------------------
 
+import os
+import threading
+
 class Singleton:
     _instance = None
+    _lock = threading.Lock()
 
     # __new__() is the method that creates a new instance of a class. (It is called before __init__)
-    def __new__(cls): 
+    # Double-checked locking: without the lock two threads can both see _instance is None and create two objects.
+    # Once the instance exists the first check returns it without touching the lock.
+    def __new__(cls):
         if cls._instance is None:
-            print("Creating the instance...")
-            cls._instance = super(Singleton, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    print("Creating the instance...")
+                    cls._instance = super(Singleton, cls).__new__(cls)
         return cls._instance
 
+# A forked child process starts with a fresh lock and without the parent's instance.
+# __new__ stores the instance on the class it was called on, so subclasses are reset as well.
+def _reset_after_fork():
+    classes = [Singleton]
+    while classes:
+        cls = classes.pop()
+        if '_lock' in vars(cls):
+            cls._lock = threading.Lock()
+        if '_instance' in vars(cls):
+            cls._instance = None
+        classes.extend(cls.__subclasses__())
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+# This file stays a self-contained illustration of the pattern, like the other pattern files.
+# Code that needs a singleton should use the shared base in Questions/SingletonBase.py (lazy get_instance(),
+# per-thread scope, reset hooks), as Logger, ParkingLot and StoreRegistry do, rather than copying this class.
+
 if __name__ == '__main__':
 
     a = Singleton()
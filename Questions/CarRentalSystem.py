@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from enum import Enum
+import time
 import uuid
+from SingletonBase import Singleton
 
 # --- Enums ---
 class VehicleType(Enum):
@@ -26,6 +29,62 @@ class HatchbackPricing(PricingStrategy):
     def get_rate(self) -> float:
         return 30.0
 
+# --- Dynamic Pricing: quotes are memoized and evicted after ttl_seconds ---
+class DynamicPricing(PricingStrategy):
+    def __init__(self, base_rate: float, ttl_seconds: float = 60.0, clock=time.monotonic):
+        self.base_rate = base_rate
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._cached_rate = None
+        self._expires_at = 0.0
+
+    def get_rate(self) -> float:
+        now = self.clock()
+        if self._cached_rate is None or now >= self._expires_at:
+            self._cached_rate = self.compute_rate()
+            self._expires_at = now + self.ttl_seconds
+        return self._cached_rate
+
+    def invalidate(self):
+        self._cached_rate = None
+
+    @abstractmethod
+    def compute_rate(self) -> float:
+        pass
+
+class DemandPricing(DynamicPricing):
+    # demand_provider returns the current utilisation as a ratio between 0 and 1
+    def __init__(self, base_rate: float, demand_provider, max_surge: float = 1.0,
+                 ttl_seconds: float = 60.0, clock=time.monotonic):
+        super().__init__(base_rate, ttl_seconds, clock)
+        self.demand_provider = demand_provider
+        self.max_surge = max_surge
+
+    def compute_rate(self) -> float:
+        demand = min(max(self.demand_provider(), 0.0), 1.0)
+        return round(self.base_rate * (1 + self.max_surge * demand), 2)
+
+# The quote is cached per calendar day instead of for a fixed TTL, so the weekday/weekend switch happens at midnight
+class DatePricing(DynamicPricing):
+    def __init__(self, base_rate: float, weekend_multiplier: float = 1.25, date_provider=date.today):
+        super().__init__(base_rate)
+        self.weekend_multiplier = weekend_multiplier
+        self.date_provider = date_provider
+        self._cached_date = None
+
+    def get_rate(self) -> float:
+        today = self.date_provider()
+        if self._cached_rate is None or today != self._cached_date:
+            self._cached_date = today
+            self._cached_rate = self.compute_rate()
+        return self._cached_rate
+
+    def compute_rate(self) -> float:
+        day = self._cached_date or self.date_provider()
+        if day.weekday() >= 5:
+            return round(self.base_rate * self.weekend_multiplier, 2)
+        return self.base_rate
+
 # --- Vehicle Base Class ---
 class Vehicle:
     def __init__(self, vehicle_id: str, license_number: str, vehicle_type: VehicleType, pricing_strategy: PricingStrategy):
@@ -42,18 +101,43 @@ class Vehicle:
         return f"{self.vehicle_type.value} - {self.license_number} - ${self.get_price()} - Available: {self.available}"
 
 # --- Factory Pattern: Vehicle Factory ---
+# Pricing strategies are stateless per vehicle type, so every vehicle shares one instance (Flyweight)
 class VehicleFactory:
-    @staticmethod
-    def create_vehicle(vehicle_type: VehicleType, license_number: str) -> Vehicle:
-        vehicle_id = str(uuid.uuid4())
-        if vehicle_type == VehicleType.SEDAN:
-            return Vehicle(vehicle_id, license_number, vehicle_type, SedanPricing())
-        elif vehicle_type == VehicleType.SUV:
-            return Vehicle(vehicle_id, license_number, vehicle_type, SuvPricing())
-        elif vehicle_type == VehicleType.HATCHBACK:
-            return Vehicle(vehicle_id, license_number, vehicle_type, HatchbackPricing())
-        else:
+    _pricing_strategies = {
+        VehicleType.SEDAN: SedanPricing(),
+        VehicleType.SUV: SuvPricing(),
+        VehicleType.HATCHBACK: HatchbackPricing(),
+    }
+
+    @classmethod
+    def set_pricing_strategy(cls, vehicle_type: VehicleType, strategy: PricingStrategy):
+        cls._pricing_strategies[vehicle_type] = strategy
+
+    @classmethod
+    def get_pricing_strategy(cls, vehicle_type: VehicleType) -> PricingStrategy:
+        strategy = cls._pricing_strategies.get(vehicle_type)
+        if strategy is None:
             raise ValueError("Unsupported vehicle type")
+        return strategy
+
+    @classmethod
+    def create_vehicle(cls, vehicle_type: VehicleType, license_number: str) -> Vehicle:
+        pricing_strategy = cls.get_pricing_strategy(vehicle_type)
+        return Vehicle(str(uuid.uuid4()), license_number, vehicle_type, pricing_strategy)
+
+    # Bulk path: one uuid per batch plus a sequence number instead of one uuid4 per vehicle
+    @classmethod
+    def create_vehicles(cls, specs) -> list:
+        strategies = cls._pricing_strategies
+        batch_id = uuid.uuid4().hex
+        vehicles = []
+        append = vehicles.append
+        for index, (vehicle_type, license_number) in enumerate(specs):
+            pricing_strategy = strategies.get(vehicle_type)
+            if pricing_strategy is None:
+                raise ValueError("Unsupported vehicle type")
+            append(Vehicle(f"{batch_id}-{index}", license_number, vehicle_type, pricing_strategy))
+        return vehicles
 
 # --- Store Class ---
 class Store:
@@ -99,21 +183,9 @@ class Store:
         return False
 
 # --- Singleton Pattern: Store Registry ---
-class StoreRegistry:
-    __instance = None
-
-    @staticmethod
-    def get_instance():
-        if StoreRegistry.__instance is None:
-            StoreRegistry()
-        return StoreRegistry.__instance
-
+class StoreRegistry(Singleton):
     def __init__(self):
-        if StoreRegistry.__instance is not None:
-            raise Exception("This class is a singleton!")
-        else:
-            StoreRegistry.__instance = self
-            self.stores = {}
+        self.stores = {}
 
     def register_store(self, store: Store):
         self.stores[store.store_id] = store
@@ -142,8 +214,9 @@ if __name__ == '__main__':
     for vehicle_type, license_num in vehicles:
         store1.add_vehicle(VehicleFactory.create_vehicle(vehicle_type, license_num))
 
-    for vehicle_type, license_num in vehicles:
-        store2.add_vehicle(VehicleFactory.create_vehicle(vehicle_type, "SF" + license_num[2:]))
+    # Bulk creation shares the same pricing strategy instances
+    for vehicle in VehicleFactory.create_vehicles((t, "SF" + num[2:]) for t, num in vehicles):
+        store2.add_vehicle(vehicle)
 
     # Show inventory
     store1.show_inventory()
@@ -142,6 +142,7 @@
 from enum import Enum
 import time
 from abc import ABC, abstractmethod
+from SingletonBase import Singleton
 
 class LogLevel(Enum):
     INFO = 1
@@ -234,21 +235,9 @@ class ErrorLogger(LogHandler):
 
 
 # Singleton Logger (Centralized Logging - avoids duplication)
-class Logger:
-    __instance = None
-
-    @staticmethod
-    def get_instance():
-        if Logger.__instance is None:
-            Logger()
-        return Logger.__instance
-
+class Logger(Singleton):
     def __init__(self):
-        if Logger.__instance is not None:
-            raise Exception("This is a singleton class.")
-        else:
-            Logger.__instance = self
-            self.config = None
+        self.config = None
 
     def set_config(self, config: LoggerConfig):
         self.config = config
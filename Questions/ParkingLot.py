@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 import uuid
+from SingletonBase import Singleton
 
 # --- Enums ---
 class VehicleType(Enum):
@@ -63,23 +64,11 @@ class ParkingTicket:
         self.exit_time = exit_time
 
 # --- Singleton: ParkingLot ---
-class ParkingLot:
-    __instance = None
-
-    @staticmethod
-    def get_instance():
-        if ParkingLot.__instance is None:
-            ParkingLot()
-        return ParkingLot.__instance
-
+class ParkingLot(Singleton):
     def __init__(self):
-        if ParkingLot.__instance is not None:
-            raise Exception("This class is a singleton!")
-        else:
-            ParkingLot.__instance = self
-            self.slots = []
-            self.tickets = {}
-            self.payment_strategy = HourlyPayment()  # default
+        self.slots = []
+        self.tickets = {}
+        self.payment_strategy = HourlyPayment()  # default
 
     def set_payment_strategy(self, strategy: PaymentStrategy):
         self.payment_strategy = strategy
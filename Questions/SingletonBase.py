@@ -0,0 +1,78 @@
+import os
+import threading
+import weakref
+
+# --- Shared Singleton base: thread-safe, lazy and fork-aware ---
+# class Logger(Singleton):
+#     def __init__(self):
+#         self.config = None
+#
+# logger = Logger.get_instance()   # created on first use, the same object afterwards
+#
+# get_instance() uses double-checked locking: once the instance exists it is returned without taking the lock.
+# scope = "thread" gives every thread its own instance instead of one per process.
+# After os.fork() the child starts with fresh locks and, if reset_on_fork is True, without the parent's instance.
+# Call Logger.reset_instance() to drop the instance by hand (e.g. between tests).
+
+_singleton_classes = weakref.WeakSet()
+_construction = threading.local()  # marks the class get_instance() is currently building on this thread
+
+
+class Singleton:
+    scope = "process"  # "process" or "thread"
+    reset_on_fork = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.scope not in ("process", "thread"):
+            raise ValueError(f"Unknown singleton scope: {cls.scope}")
+        cls._instance = None
+        cls._local = threading.local()
+        cls._lock = threading.Lock()
+        _singleton_classes.add(cls)
+
+    def __new__(cls, *args, **kwargs):
+        if getattr(_construction, "cls", None) is not cls:
+            raise Exception(f"{cls.__name__} is a singleton, use {cls.__name__}.get_instance()")
+        return super().__new__(cls)
+
+    @classmethod
+    def _create(cls):
+        _construction.cls = cls
+        try:
+            return cls()
+        finally:
+            _construction.cls = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls.scope == "thread":
+            instance = getattr(cls._local, "instance", None)
+            if instance is None:
+                instance = cls._local.instance = cls._create()
+            return instance
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance  # another thread may have created it while we waited
+                if instance is None:
+                    instance = cls._instance = cls._create()
+        return instance
+
+    @classmethod
+    def reset_instance(cls):
+        with cls._lock:
+            cls._instance = None
+            cls._local = threading.local()
+
+
+def _reset_after_fork():
+    for cls in list(_singleton_classes):
+        cls._lock = threading.Lock()  # the parent's lock may have been held by a thread that doesn't exist here
+        if cls.reset_on_fork:
+            cls._instance = None
+            cls._local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
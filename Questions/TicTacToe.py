@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
 import random
+import struct
+import time
 
 # WE have set the default board size to 3, but we can modify it if we want
 # --- Player Strategy Interface --- Using Strategy Design Pattern
@@ -28,19 +33,242 @@ class HumanPlayer(PlayerStrategy):
 
 # --- AI Player Strategy ---
 class AIPlayer(PlayerStrategy):
-    def __init__(self, name, symbol):
+    def __init__(self, name, symbol, rng=None, verbose=True):
         self.name = name
         self.symbol = symbol
+        self.rng = rng or random
+        self.verbose = verbose
 
     def get_move(self, board):
-        print(f"{self.name} ({self.symbol}) is making a move...")
-        empty_cells = [(i, j) for i in range(board.size) for j in range(board.size) if board.grid[i][j] == ' ']
-        return random.choice(empty_cells)
+        if self.verbose:
+            print(f"{self.name} ({self.symbol}) is making a move...")
+        empty_cells = [(i, j) for i in range(board.size) for j in range(board.size) if board.is_valid_move(i, j)]
+        return self.rng.choice(empty_cells)
+
+# --- Minimax AI Player Strategy ---
+# Negamax with alpha-beta pruning, iterative deepening under a time budget and a Zobrist-hashed transposition table.
+# The search runs on its own flat copy of the board, so it works with any Board backend and with k-in-a-row boards.
+class _SearchTimeout(Exception):
+    pass
+
+class MinimaxAIPlayer(PlayerStrategy):
+    WIN_SCORE = 10 ** 15
+    MATE_THRESHOLD = WIN_SCORE - 10 ** 6
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    _zobrist_keys = {}  # board size -> (per-cell keys for both players, side-to-move key)
+    _line_cache = {}    # (board size, win length) -> (windows, windows through each cell, move order)
+
+    def __init__(self, name, symbol, opponent_symbol=None, win_length=None, time_limit=1.0,
+                 max_depth=None, table_size=1 << 18, verbose=True):
+        self.name = name
+        self.symbol = symbol
+        self.opponent_symbol = opponent_symbol or ('X' if symbol == 'O' else 'O')
+        self.win_length = win_length
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.verbose = verbose
+        self._mask = table_size - 1  # table_size must be a power of two
+        self._table = [None] * table_size
+        self._generation = 0
+
+    def get_move(self, board):
+        if self.verbose:
+            print(f"{self.name} ({self.symbol}) is making a move...")
+        size = board.size
+        win_length = self.win_length or getattr(board, 'win_length', size)
+        self._setup(size, win_length)
+        self._cells = [0] * (size * size)
+        self._hash = 0  # player 1 (this player) is to move at the root
+        empty_count = 0
+        for i in range(size):
+            for j in range(size):
+                if board.is_valid_move(i, j):
+                    empty_count += 1
+                    continue
+                player = 1 if board.cell(i, j) == self.symbol else 2
+                self._place(i * size + j, player)
+        self._empty_count = empty_count
+
+        self._generation += 1
+        self._nodes = 0
+        self._deadline = time.perf_counter() + self.time_limit
+        max_depth = min(self.max_depth or empty_count, empty_count)
+        best_move = next(cell for cell in self._order if self._cells[cell] == 0)
+        for depth in range(1, max_depth + 1):
+            try:
+                value, move = self._search_root(depth)
+            except _SearchTimeout:
+                break
+            best_move = move
+            if abs(value) >= self.MATE_THRESHOLD:
+                break
+        return divmod(best_move, size)
+
+    def _setup(self, size, win_length):
+        if size not in self._zobrist_keys:
+            rng = random.Random(size)
+            keys = [(0, rng.getrandbits(64), rng.getrandbits(64)) for _ in range(size * size)]
+            self._zobrist_keys[size] = (keys, rng.getrandbits(64))
+        self._keys, self._side_key = self._zobrist_keys[size]
+
+        cache_key = (size, win_length)
+        if cache_key not in self._line_cache:
+            windows = []
+            for row in range(size):
+                for col in range(size):
+                    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                        end_row, end_col = row + dr * (win_length - 1), col + dc * (win_length - 1)
+                        if 0 <= end_row < size and 0 <= end_col < size:
+                            windows.append(tuple((row + dr * t) * size + col + dc * t for t in range(win_length)))
+            cell_windows = [[] for _ in range(size * size)]
+            for window in windows:
+                for cell in window:
+                    cell_windows[cell].append(window)
+            # Cells that sit in more winning windows are tried first
+            order = sorted(range(size * size), key=lambda cell: -len(cell_windows[cell]))
+            self._line_cache[cache_key] = (windows, cell_windows, order)
+        self._windows, self._cell_windows, self._order = self._line_cache[cache_key]
+
+    def _place(self, cell, player):
+        self._cells[cell] = player
+        self._hash ^= self._keys[cell][player]
+
+    def _remove(self, cell, player):
+        self._cells[cell] = 0
+        self._hash ^= self._keys[cell][player]
+
+    def _wins(self, cell, player):
+        cells = self._cells
+        for window in self._cell_windows[cell]:
+            if all(cells[i] == player for i in window):
+                return True
+        return False
+
+    def _evaluate(self, player):
+        cells = self._cells
+        score = 0
+        for window in self._windows:
+            mine = theirs = 0
+            for i in window:
+                if cells[i] == player:
+                    mine += 1
+                elif cells[i]:
+                    theirs += 1
+            if not theirs and mine:
+                score += 4 ** mine
+            elif not mine and theirs:
+                score -= 4 ** theirs
+        return score
+
+    def _ordered_moves(self, first_move):
+        cells = self._cells
+        if first_move is not None and cells[first_move] == 0:
+            yield first_move
+        for cell in self._order:
+            if cells[cell] == 0 and cell != first_move:
+                yield cell
+
+    def _probe(self):
+        entry = self._table[self._hash & self._mask]
+        if entry is not None and entry[0] == self._hash:
+            return entry
+        return None
+
+    # Replacement policy: keep the deeper entry unless the stored one is from an older search
+    def _store(self, depth, value, flag, move, ply):
+        index = self._hash & self._mask
+        entry = self._table[index]
+        if entry is None or entry[5] != self._generation or depth >= entry[1]:
+            if value >= self.MATE_THRESHOLD:
+                value += ply
+            elif value <= -self.MATE_THRESHOLD:
+                value -= ply
+            self._table[index] = (self._hash, depth, value, flag, move, self._generation)
+
+    def _search_root(self, depth):
+        entry = self._probe()
+        alpha, beta = -self.WIN_SCORE - 1, self.WIN_SCORE + 1
+        best_value, best_move = -self.WIN_SCORE - 1, None
+        for cell in self._ordered_moves(entry[4] if entry else None):
+            value = self._score_move(cell, 1, depth, alpha, beta, 0)
+            if value > best_value:
+                best_value, best_move = value, cell
+            alpha = max(alpha, value)
+        self._store(depth, best_value, self.EXACT, best_move, 0)
+        return best_value, best_move
+
+    def _score_move(self, cell, player, depth, alpha, beta, ply):
+        self._place(cell, player)
+        self._hash ^= self._side_key
+        self._empty_count -= 1
+        try:
+            if self._wins(cell, player):
+                return self.WIN_SCORE - (ply + 1)
+            if self._empty_count == 0:
+                return 0
+            return -self._negamax(3 - player, depth - 1, -beta, -alpha, ply + 1)
+        finally:
+            self._empty_count += 1
+            self._hash ^= self._side_key
+            self._remove(cell, player)
+
+    def _negamax(self, player, depth, alpha, beta, ply):
+        self._nodes += 1
+        if self._nodes & 1023 == 0 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+        alpha_orig = alpha
+        entry = self._probe()
+        if entry is not None and entry[1] >= depth:
+            value = entry[2]
+            if value >= self.MATE_THRESHOLD:
+                value -= ply
+            elif value <= -self.MATE_THRESHOLD:
+                value += ply
+            if entry[3] == self.EXACT:
+                return value
+            if entry[3] == self.LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+        if depth == 0:
+            return self._evaluate(player)
+
+        best_value, best_move = -self.WIN_SCORE - 1, None
+        for cell in self._ordered_moves(entry[4] if entry else None):
+            value = self._score_move(cell, player, depth, alpha, beta, ply)
+            if value > best_value:
+                best_value, best_move = value, cell
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = self.UPPER
+        elif best_value >= beta:
+            flag = self.LOWER
+        else:
+            flag = self.EXACT
+        self._store(depth, best_value, flag, best_move, ply)
+        return best_value
+
+# win_length defaults to the board size and must fit on the board
+def _resolve_win_length(size, win_length):
+    if win_length is None:
+        return size
+    if not 1 <= win_length <= size:
+        raise ValueError(f"win_length must be between 1 and the board size ({size}), got {win_length}")
+    return win_length
 
 # --- Board Class ---
+# win_length defaults to the board size; a smaller value plays the k-in-a-row variant
 class Board:
-    def __init__(self, size=3):
+    def __init__(self, size=3, win_length=None):
         self.size = size
+        self.win_length = _resolve_win_length(size, win_length)
         self.grid = [[' ' for _ in range(size)] for _ in range(size)]
 
     def display(self):
@@ -51,13 +279,25 @@ class Board:
     def is_valid_move(self, row, col):
         return 0 <= row < self.size and 0 <= col < self.size and self.grid[row][col] == ' '
 
+    def cell(self, row, col):
+        return self.grid[row][col]
+
     def make_move(self, row, col, symbol):
         if self.is_valid_move(row, col):
             self.grid[row][col] = symbol
             return True
         return False
 
+    def undo_move(self, row, col):
+        if self.grid[row][col] == ' ':
+            return False
+        self.grid[row][col] = ' '
+        return True
+
     def check_winner(self, symbol):
+        if self.win_length < self.size:
+            return any(self.has_line_through(i, j, symbol)
+                       for i in range(self.size) for j in range(self.size) if self.grid[i][j] == symbol)
         for i in range(self.size):
             if all(self.grid[i][j] == symbol for j in range(self.size)) or \
                all(self.grid[j][i] == symbol for j in range(self.size)):
@@ -67,13 +307,374 @@ class Board:
             return True
         return False
 
+    def has_line_through(self, row, col, symbol):
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * dr, col + sign * dc
+                while 0 <= r < self.size and 0 <= c < self.size and self.grid[r][c] == symbol:
+                    count += 1
+                    r, c = r + sign * dr, c + sign * dc
+            if count >= self.win_length:
+                return True
+        return False
+
     def is_full(self):
         return all(cell != ' ' for row in self.grid for cell in row)
 
+# --- Incremental Board: O(1) win and full checks ---
+# Keeps per-symbol counts for every row, column and both diagonals, so a move only touches the lines through its cell.
+# For k-in-a-row boards a move checks the runs through its own cell instead.
+class IncrementalBoard(Board):
+    def __init__(self, size=3, win_length=None):
+        super().__init__(size, win_length)
+        self.row_counts = {}
+        self.col_counts = {}
+        self.diag_counts = {}  # symbol -> [main diagonal, anti diagonal]
+        self.completed_lines = {}
+        self.move_count = 0
+
+    def _update_counts(self, row, col, symbol, delta):
+        if symbol not in self.row_counts:
+            self.row_counts[symbol] = [0] * self.size
+            self.col_counts[symbol] = [0] * self.size
+            self.diag_counts[symbol] = [0, 0]
+            self.completed_lines[symbol] = 0
+        self.move_count += delta
+        if self.win_length < self.size:
+            return
+        lines = [(self.row_counts[symbol], row), (self.col_counts[symbol], col)]
+        if row == col:
+            lines.append((self.diag_counts[symbol], 0))
+        if row + col == self.size - 1:
+            lines.append((self.diag_counts[symbol], 1))
+        for counts, index in lines:
+            if delta < 0 and counts[index] == self.size:
+                self.completed_lines[symbol] -= 1
+            counts[index] += delta
+            if delta > 0 and counts[index] == self.size:
+                self.completed_lines[symbol] += 1
+
+    def make_move(self, row, col, symbol):
+        if self.is_valid_move(row, col):
+            self.grid[row][col] = symbol
+            self._update_counts(row, col, symbol, 1)
+            if self.win_length < self.size and self.has_line_through(row, col, symbol):
+                self.completed_lines[symbol] = 1
+            return True
+        return False
+
+    def undo_move(self, row, col):
+        symbol = self.grid[row][col]
+        if symbol == ' ':
+            return False
+        self.grid[row][col] = ' '
+        self._update_counts(row, col, symbol, -1)
+        # Removing a stone can only break the owner's own run, so rescan just that symbol
+        if self.win_length < self.size and self.completed_lines[symbol]:
+            self.completed_lines[symbol] = int(Board.check_winner(self, symbol))
+        return True
+
+    def check_winner(self, symbol):
+        return self.completed_lines.get(symbol, 0) > 0
+
+    def is_full(self):
+        return self.move_count == self.size * self.size
+
+# --- Bitboard Board: each symbol's stones are stored as one integer bitmask ---
+# Cell (row, col) is bit row * size + col. Win masks are precomputed once per (size, win_length),
+# and a move only tests the masks that pass through its own cell.
+class BitBoard:
+    _mask_cache = {}  # (size, win_length) -> (all win masks, win masks through each cell)
+
+    def __init__(self, size=3, win_length=None):
+        self.size = size
+        self.win_length = _resolve_win_length(size, win_length)
+        self.bits = {}  # symbol -> bitmask of that symbol's stones
+        self.occupied = 0
+        self.full_mask = (1 << (size * size)) - 1
+        self.winners = set()
+        self.win_masks, self.cell_masks = self._get_masks(size, self.win_length)
+
+    @classmethod
+    def _get_masks(cls, size, win_length):
+        key = (size, win_length)
+        if key not in cls._mask_cache:
+            win_masks = []
+            cell_masks = [[] for _ in range(size * size)]
+            for row in range(size):
+                for col in range(size):
+                    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                        end_row, end_col = row + dr * (win_length - 1), col + dc * (win_length - 1)
+                        if not (0 <= end_row < size and 0 <= end_col < size):
+                            continue
+                        cells = [(row + dr * t) * size + col + dc * t for t in range(win_length)]
+                        mask = sum(1 << cell for cell in cells)
+                        win_masks.append(mask)
+                        for cell in cells:
+                            cell_masks[cell].append(mask)
+            cls._mask_cache[key] = (win_masks, cell_masks)
+        return cls._mask_cache[key]
+
+    # Read-only view for code that still expects Board.grid
+    @property
+    def grid(self):
+        return [[self.cell(i, j) for j in range(self.size)] for i in range(self.size)]
+
+    def display(self):
+        for row in self.grid:
+            print('|'.join(row))
+            print('-' * (2 * self.size - 1))
+
+    def is_valid_move(self, row, col):
+        return 0 <= row < self.size and 0 <= col < self.size and not self.occupied >> (row * self.size + col) & 1
+
+    def cell(self, row, col):
+        bit = 1 << (row * self.size + col)
+        if self.occupied & bit:
+            for symbol, bits in self.bits.items():
+                if bits & bit:
+                    return symbol
+        return ' '
+
+    def make_move(self, row, col, symbol):
+        if not self.is_valid_move(row, col):
+            return False
+        cell = row * self.size + col
+        bits = self.bits.get(symbol, 0) | (1 << cell)
+        self.bits[symbol] = bits
+        self.occupied |= 1 << cell
+        for mask in self.cell_masks[cell]:
+            if bits & mask == mask:
+                self.winners.add(symbol)
+                break
+        return True
+
+    def undo_move(self, row, col):
+        symbol = self.cell(row, col)
+        if symbol == ' ':
+            return False
+        bit = 1 << (row * self.size + col)
+        self.bits[symbol] ^= bit
+        self.occupied ^= bit
+        if symbol in self.winners:
+            bits = self.bits[symbol]
+            if not any(bits & mask == mask for mask in self.win_masks):
+                self.winners.discard(symbol)
+        return True
+
+    def check_winner(self, symbol):
+        return symbol in self.winners
+
+    def is_full(self):
+        return self.occupied == self.full_mask
+
+    # Hashable snapshot of the position, e.g. for transposition tables
+    def key(self):
+        return tuple(sorted(self.bits.items()))
+
+    def copy(self):
+        board = BitBoard.__new__(BitBoard)
+        board.__dict__.update(self.__dict__)
+        board.bits = dict(self.bits)
+        board.winners = set(self.winners)
+        return board
+
+# --- Opening Book: offline solver + memory-mapped lookup ---
+# Positions are stored from the point of view of the player to move: key = own stones | opponent stones << (size * size).
+# Each position is reduced to the smallest key over the 8 board symmetries, so one entry covers all of its rotations/reflections.
+# File layout: header (magic, size, win_length, entry count) followed by fixed-size records sorted by key.
+BOOK_MAGIC = b'TTTB'
+BOOK_HEADER = struct.Struct('<4sBBI')
+BOOK_RECORD = struct.Struct('<QBb')  # key, best move (canonical orientation), value for the player to move
+
+def _symmetries(size):
+    transforms = (
+        lambda r, c: (r, c), lambda r, c: (c, size - 1 - r),
+        lambda r, c: (size - 1 - r, size - 1 - c), lambda r, c: (size - 1 - c, r),
+        lambda r, c: (r, size - 1 - c), lambda r, c: (c, r),
+        lambda r, c: (size - 1 - r, c), lambda r, c: (size - 1 - c, size - 1 - r),
+    )
+    perms = []
+    for transform in transforms:
+        perm = [0] * (size * size)
+        for cell in range(size * size):
+            r, c = transform(*divmod(cell, size))
+            perm[cell] = r * size + c
+        inverse = [0] * (size * size)
+        for cell, target in enumerate(perm):
+            inverse[target] = cell
+        perms.append((perm, inverse))
+    return perms
+
+def _permute(mask, perm):
+    result = 0
+    while mask:
+        low = mask & -mask
+        result |= 1 << perm[low.bit_length() - 1]
+        mask ^= low
+    return result
+
+def _canonical(own, other, size, perms):
+    shift = size * size
+    best_key, best_index = None, 0
+    for index, (perm, _) in enumerate(perms):
+        key = _permute(own, perm) | _permute(other, perm) << shift
+        if best_key is None or key < best_key:
+            best_key, best_index = key, index
+    return best_key, best_index
+
+class _BookSolver:
+    def __init__(self, size, win_length, search_depth):
+        self.size = size
+        self.cells = size * size
+        self.search_depth = search_depth
+        self.perms = _symmetries(size)
+        _, self.cell_masks = BitBoard._get_masks(size, win_length)
+        # Try central cells first so ties resolve towards stronger moves
+        self.order = sorted(range(self.cells), key=lambda cell: -len(self.cell_masks[cell]))
+        self.memo = {}
+
+    def wins(self, bits, cell):
+        return any(bits & mask == mask for mask in self.cell_masks[cell])
+
+    # Value for the player to move: 1 win, 0 draw (or unresolved within the depth limit), -1 loss
+    def value(self, own, other, depth):
+        occupied = own | other
+        depth = min(depth, self.cells - bin(occupied).count('1'))  # searching past a full board changes nothing
+        if depth == 0:
+            return 0
+        key = (_canonical(own, other, self.size, self.perms)[0], depth)
+        if key in self.memo:
+            return self.memo[key]
+        best = -1
+        for cell in self.order:
+            if occupied >> cell & 1:
+                continue
+            if self.wins(own | 1 << cell, cell):
+                best = 1
+                break
+            best = max(best, -self.value(other, own | 1 << cell, depth - 1))
+            if best == 1:
+                break
+        self.memo[key] = best
+        return best
+
+    def best_move(self, own, other):
+        occupied = own | other
+        best_value, best_cell = -2, None
+        for cell in self.order:
+            if occupied >> cell & 1:
+                continue
+            if self.wins(own | 1 << cell, cell):
+                return cell, 1
+            value = -self.value(other, own | 1 << cell, self.search_depth - 1)
+            if value > best_value:
+                best_value, best_cell = value, cell
+        return best_cell, best_value
+
+def build_opening_book(path, size=3, win_length=None, book_plies=None, search_depth=None):
+    if size * size * 2 > 64:
+        raise ValueError("Opening books support boards up to 5x5")
+    win_length = _resolve_win_length(size, win_length)
+    book_plies = size * size if book_plies is None else book_plies
+    solver = _BookSolver(size, win_length, search_depth or size * size)
+
+    entries = {}
+    frontier = {(0, 0)}  # (stones of the player to move, stones of the opponent)
+    for _ in range(book_plies):
+        next_frontier = set()
+        for own, other in frontier:
+            key, index = _canonical(own, other, size, solver.perms)
+            if key in entries:
+                continue
+            cell, value = solver.best_move(own, other)
+            if cell is None:
+                continue
+            entries[key] = (solver.perms[index][0][cell], value)
+            occupied = own | other
+            for move in range(size * size):
+                if not occupied >> move & 1 and not solver.wins(own | 1 << move, move):
+                    next_frontier.add((other, own | 1 << move))
+        frontier = next_frontier
+
+    with open(path, 'wb') as f:
+        f.write(BOOK_HEADER.pack(BOOK_MAGIC, size, win_length, len(entries)))
+        for key in sorted(entries):
+            f.write(BOOK_RECORD.pack(key, *entries[key]))
+    return len(entries)
+
+class OpeningBook:
+    def __init__(self, path):
+        self.path = path
+        self._data = None  # mapped on first lookup
+
+    def supports(self, size, win_length):
+        if self._data is None:
+            self._load()
+        return self.size == size and self.win_length == win_length
+
+    def _load(self):
+        with open(self.path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size, self.win_length, self.count = BOOK_HEADER.unpack_from(self._data, 0)
+        if magic != BOOK_MAGIC:
+            raise ValueError(f"{self.path} is not an opening book")
+        self._perms = _symmetries(self.size)
+
+    # Returns (cell, value) for the player to move, or None if the position is not in the book
+    def lookup(self, own, other):
+        if self._data is None:
+            self._load()
+        key, index = _canonical(own, other, self.size, self._perms)
+        low, high = 0, self.count - 1
+        while low <= high:
+            mid = (low + high) // 2
+            record_key, cell, value = BOOK_RECORD.unpack_from(self._data, BOOK_HEADER.size + mid * BOOK_RECORD.size)
+            if record_key == key:
+                return self._perms[index][1][cell], value
+            if record_key < key:
+                low = mid + 1
+            else:
+                high = mid - 1
+        return None
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+# --- Book Player Strategy: plays from the opening book, falls back to search outside it ---
+class BookPlayer(PlayerStrategy):
+    def __init__(self, name, symbol, book_path, fallback=None, verbose=True):
+        self.name = name
+        self.symbol = symbol
+        self.book = OpeningBook(book_path)
+        self.fallback = fallback or MinimaxAIPlayer(name, symbol, verbose=False)
+        self.verbose = verbose
+
+    def get_move(self, board):
+        if self.verbose:
+            print(f"{self.name} ({self.symbol}) is making a move...")
+        own = other = 0
+        for i in range(board.size):
+            for j in range(board.size):
+                if not board.is_valid_move(i, j):
+                    if board.cell(i, j) == self.symbol:
+                        own |= 1 << (i * board.size + j)
+                    else:
+                        other |= 1 << (i * board.size + j)
+        if self.book.supports(board.size, board.win_length):
+            entry = self.book.lookup(own, other)
+            if entry is not None:
+                return divmod(entry[0], board.size)
+        return self.fallback.get_move(board)
+
 # --- Game Context ---
 class GameContext:
-    def __init__(self, player1: PlayerStrategy, player2: PlayerStrategy, board_size=3):
-        self.board = Board(board_size)
+    def __init__(self, player1: PlayerStrategy, player2: PlayerStrategy, board_size=3, board_cls=IncrementalBoard,
+                 win_length=None):
+        self.board = board_cls(board_size, win_length)
         self.players = [player1, player2]
         self.turn = 0
 
@@ -98,10 +699,106 @@ class GameContext:
 
             self.switch_turn()
 
+    # Plays the game without printing or prompting; returns the winning player (None for a draw) and the moves
+    def play_headless(self):
+        moves = []
+        while True:
+            current_player = self.players[self.turn]
+            row, col = current_player.get_move(self.board)
+            if not self.board.make_move(row, col, current_player.symbol):
+                raise ValueError(f"{current_player.name} made an invalid move: {(row, col)}")
+            moves.append((row, col))
+
+            if self.board.check_winner(current_player.symbol):
+                return current_player, moves
+            elif self.board.is_full():
+                return None, moves
+
+            self.switch_turn()
+
+# --- Tournament Runner: headless self-play across a process pool ---
+# Players are passed as picklable factories (e.g. functools.partial(AIPlayer, "Bot", "X", verbose=False)).
+# Game i gets its own random.Random(seed + i), handed to every player with an rng attribute,
+# so results do not depend on the number of workers and the global random module is left alone.
+class TournamentResult:
+    def __init__(self, wins=0, draws=0, losses=0, elapsed=0.0, games_played=None):
+        self.wins = wins      # counted from player 1's point of view
+        self.draws = draws
+        self.losses = losses
+        self.elapsed = elapsed
+        self.games_played = games_played  # (player 1 went first, moves, result) per game when recorded
+
+    @property
+    def games(self):
+        return self.wins + self.draws + self.losses
+
+    @property
+    def games_per_second(self):
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def merge(self, other):
+        self.wins += other.wins
+        self.draws += other.draws
+        self.losses += other.losses
+        if other.games_played is not None:
+            if self.games_played is None:
+                self.games_played = []
+            self.games_played.extend(other.games_played)
+
+    def __str__(self):
+        return (f"Games: {self.games}, Wins: {self.wins}, Draws: {self.draws}, Losses: {self.losses}, "
+                f"{self.games_per_second:.0f} games/sec")
+
+def _play_tournament_chunk(player1_factory, player2_factory, start, count, seed, board_size, board_cls,
+                           win_length, swap_sides, record_moves):
+    player1, player2 = player1_factory(), player2_factory()
+    seeded = [player for player in (player1, player2) if hasattr(player, "rng")]
+    result = TournamentResult(games_played=[] if record_moves else None)
+    for game_index in range(start, start + count):
+        rng = random.Random(seed + game_index)
+        for player in seeded:
+            player.rng = rng
+        player1_first = not (swap_sides and game_index % 2)
+        order = (player1, player2) if player1_first else (player2, player1)
+        winner, moves = GameContext(*order, board_size, board_cls, win_length).play_headless()
+        if winner is None:
+            result.draws += 1
+        elif winner is player1:
+            result.wins += 1
+        else:
+            result.losses += 1
+        if record_moves:
+            outcome = 0 if winner is None else (1 if winner is player1 else -1)
+            result.games_played.append((player1_first, moves, outcome))
+    return result
+
+def run_tournament(player1_factory, player2_factory, games=1000, workers=None, seed=0, board_size=3,
+                   board_cls=IncrementalBoard, win_length=None, swap_sides=True, record_moves=False, chunk_size=500):
+    workers = workers or os.cpu_count() or 1
+    chunks = [(start, min(chunk_size, games - start)) for start in range(0, games, chunk_size)]
+    args = (player1_factory, player2_factory)
+    options = (seed, board_size, board_cls, win_length, swap_sides, record_moves)
+
+    total = TournamentResult(games_played=[] if record_moves else None)
+    started = time.perf_counter()
+    if workers == 1:
+        for start, count in chunks:
+            total.merge(_play_tournament_chunk(*args, start, count, *options))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_play_tournament_chunk, *args, start, count, *options) for start, count in chunks]
+            for future in futures:
+                total.merge(future.result())
+    total.elapsed = time.perf_counter() - started
+    return total
+
 # --- Run Game ---
 if __name__ == '__main__':
     p1 = HumanPlayer("Alice", "X")
    # p2 = HumanPlayer("Jones", "X")
     p2 = AIPlayer("Computer", "O")
+   # p2 = MinimaxAIPlayer("Computer", "O", time_limit=1.0)
+   # build_opening_book("tictactoe_3x3.book")  # one-off, offline
+   # p2 = BookPlayer("Computer", "O", "tictactoe_3x3.book")
     game = GameContext(p1, p2)
     game.start_game()
@@ -0,0 +1,210 @@
+#----------------------------------Adapter Design Pattern-------------------------------------------------------------------------
+
+"""
+The Adapter Pattern lets two incompatible interfaces work together.
+The adapter wraps an existing object and exposes the interface the client expects, translating every call.
+Eg. A travel plug adapter: the socket stays the same, the plug stays the same, the adapter sits in between.
+"""
+
+#-----------------------------------------Use Case-------------------------------------------------------------------------------
+"""
+You want to reuse an existing class, but its interface doesn't match the one you need.
+You integrate a third party / legacy API without changing either side.
+
+In this project most interfaces handle one item per call:
+    LogAppender.append(log_message)
+    PaymentStrategy.pay(amount) / PaymentStrategy.calculate_fee(duration_hours)
+    PricingStrategy.get_rate()
+High-throughput backends (log shippers, settlement services, message queues) want batches instead.
+The adapters below translate in both directions:
+    SingleToBatchAdapter -> makes a one-at-a-time object look like a batch sink
+    MicroBatcher         -> makes a batch sink look like a one-at-a-time object, grouping items by size and time
+"""
+
+#-------------------------------------------Code-----------------------------------------------------------------------------
+
+from abc import ABC, abstractmethod
+import threading
+import time
+
+# Target Interface: a sink that takes many items per call
+class BatchSink(ABC):
+    @abstractmethod
+    def write_batch(self, items):
+        pass
+
+    def write_stream(self, items, batch_size=1000):
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                self.write_batch(batch)
+                batch = []
+        if batch:
+            self.write_batch(batch)
+
+# Adapter: single-item object -> BatchSink
+# method is the single-item method to call, e.g. "append", "pay", "calculate_fee".
+# With unpack=True every item is a tuple of arguments (use () for methods without arguments such as get_rate).
+class SingleToBatchAdapter(BatchSink):
+    def __init__(self, adaptee, method, unpack=False):
+        self.adaptee = adaptee
+        self.method = method
+        self.unpack = unpack
+
+    def write_batch(self, items):
+        call = getattr(self.adaptee, self.method)
+        if self.unpack:
+            return [call(*args) for args in items]
+        return [call(item) for item in items]
+
+# Adapter: BatchSink -> single-item calls, with micro-batching
+# Items are buffered and handed to the sink when max_batch_size is reached or the oldest item is max_delay seconds old.
+# Items are passed through as they are, so bytes/memoryview payloads reach the sink without being copied.
+# Every write_batch call gets at most max_batch_size items.
+# If the sink raises, the batch goes to on_error(batch, exception) when given. Otherwise it is put back at the
+# front of the buffer and the exception is raised to the caller that flushed. While the sink is failing, submit()
+# stops flushing and leaves the retries to flush() and the timer thread, and once max_backlog items are waiting
+# submit() raises BufferError instead of letting the backlog grow without bound.
+class MicroBatcher:
+    def __init__(self, sink: BatchSink, max_batch_size=1000, max_delay=None, on_error=None, max_backlog=None):
+        self.sink = sink
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.on_error = on_error
+        self.max_backlog = 10 * max_batch_size if max_backlog is None else max_backlog
+        self._buffer = []
+        self._oldest = None
+        self._failing = False                # the last write failed and its batch is waiting in the buffer
+        self._lock = threading.Lock()        # guards the buffer
+        self._write_lock = threading.Lock()  # keeps batches in submission order
+        self._closed = threading.Event()
+        self._timer = None
+        if max_delay is not None:
+            self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._timer.start()
+
+    def submit(self, item):
+        with self._lock:
+            if len(self._buffer) >= self.max_backlog:
+                raise BufferError(f"{len(self._buffer)} items are waiting for a failing sink")
+            if not self._buffer:
+                self._oldest = time.monotonic()
+            self._buffer.append(item)
+            full = len(self._buffer) >= self.max_batch_size and not self._failing
+        if full:
+            self.flush()
+
+    def submit_many(self, items):
+        for item in items:
+            self.submit(item)
+
+    def flush(self):
+        with self._write_lock:
+            while True:
+                with self._lock:
+                    if len(self._buffer) <= self.max_batch_size:
+                        batch, self._buffer = self._buffer, []
+                    else:
+                        batch = self._buffer[:self.max_batch_size]
+                        del self._buffer[:self.max_batch_size]
+                    oldest = self._oldest
+                    if not self._buffer:
+                        self._oldest = None
+                if not batch:
+                    return
+                try:
+                    self.sink.write_batch(batch)
+                except Exception as e:
+                    if self.on_error is not None:
+                        self.on_error(batch, e)
+                        continue
+                    with self._lock:
+                        self._buffer[:0] = batch
+                        self._oldest = oldest
+                        self._failing = True
+                    raise
+                self._failing = False
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.max_delay / 2):
+            oldest = self._oldest
+            if oldest is not None and time.monotonic() - oldest >= self.max_delay:
+                try:
+                    self.flush()
+                except Exception:
+                    pass  # the batch was requeued and is retried on the next tick; keep the timer alive
+
+    def close(self):
+        self._closed.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+
+# Adapter: BatchSink -> LogAppender (append) interface
+class BatchingLogAppender(MicroBatcher):
+    def append(self, log_message):
+        self.submit(log_message)
+
+# Adapter: BatchSink -> PaymentStrategy (pay) interface
+class BatchingPaymentStrategy(MicroBatcher):
+    def pay(self, amount):
+        self.submit(amount)
+
+# Splits a framed buffer into fixed-size records as memoryview slices (no copying)
+def split_frames(buffer, frame_size):
+    view = memoryview(buffer)
+    return [view[start:start + frame_size] for start in range(0, len(view), frame_size)]
+
+# Local in-process stand-in for a bulk backend, used for demos and benchmarks
+# call_overhead simulates the fixed cost of one round trip to the backend.
+class InMemoryBatchSink(BatchSink):
+    def __init__(self, call_overhead=0.0, keep_items=False):
+        self.call_overhead = call_overhead
+        self.keep_items = keep_items
+        self.items = []
+        self.batches = 0
+        self.item_count = 0
+        self.byte_count = 0
+
+    def write_batch(self, items):
+        if self.call_overhead:
+            time.sleep(self.call_overhead)
+        self.batches += 1
+        self.item_count += len(items)
+        for item in items:
+            if isinstance(item, (bytes, bytearray, memoryview)):
+                self.byte_count += memoryview(item).nbytes
+        if self.keep_items:
+            self.items.extend(items)
+        return len(items)
+
+# Client Code
+if __name__ == "__main__":
+    # An existing one-at-a-time strategy (same shape as ParkingLot's HourlyPayment)
+    class HourlyPayment:
+        def calculate_fee(self, duration_hours):
+            return 10.0 * duration_hours
+
+    # One-at-a-time -> batch
+    fees = SingleToBatchAdapter(HourlyPayment(), "calculate_fee").write_batch([1, 2, 5])
+    print(f"Batch of fees: {fees}")
+
+    # Batch sink -> one-at-a-time appender, flushed every 3 messages or after 50ms
+    sink = InMemoryBatchSink(keep_items=True)
+    appender = BatchingLogAppender(sink, max_batch_size=3, max_delay=0.05)
+    for i in range(7):
+        appender.append(f"[INFO] message {i}")
+    print(f"Batches written so far: {sink.batches}")
+    time.sleep(0.1)
+    print(f"Batches after the time-based flush: {sink.batches}, items: {sink.item_count}")
+    appender.close()
+
+    # Zero-copy payloads: memoryview slices of one buffer are handed over as they are
+    payload = bytes(64 * 1024)
+    frames = split_frames(payload, 4096)
+    byte_sink = InMemoryBatchSink()
+    batcher = MicroBatcher(byte_sink, max_batch_size=8)
+    batcher.submit_many(frames)
+    batcher.close()
+    print(f"Frames: {len(frames)}, batches: {byte_sink.batches}, bytes delivered: {byte_sink.byte_count}")